@@ -13,9 +13,14 @@ A2UI Protocol Compliance:
 - Optional children field for layout components
 """
 
-import uuid
+import sys
 import json
+import uuid
 import re
+import itertools
+from functools import lru_cache
+from types import MappingProxyType
+import orjson
 from typing import Any, AsyncGenerator
 from pydantic import BaseModel, Field, field_validator
 
@@ -128,7 +133,8 @@ class A2UIComponent(BaseModel):
 
     type: str = Field(
         description="A2UI component type (must start with 'a2ui.')",
-        pattern=r"^a2ui\.[A-Z][a-zA-Z0-9]*$"
+        # Enforced by validate_type; kept here so the JSON schema still shows it
+        json_schema_extra={"pattern": r"^a2ui\.[A-Z][a-zA-Z0-9]*$"}
     )
 
     id: str = Field(
@@ -158,9 +164,12 @@ class A2UIComponent(BaseModel):
     @field_validator('type')
     @classmethod
     def validate_type(cls, v: str) -> str:
-        """Validate that type follows a2ui.ComponentName format."""
-        if not v.startswith('a2ui.'):
-            raise ValueError(f"Component type must start with 'a2ui.', got: {v}")
+        """Validate that type follows a2ui.ComponentName format (PascalCase name)."""
+        name = v[5:]
+        if not (v.startswith('a2ui.') and name[:1].isupper() and name.isascii() and name.isalnum()):
+            raise ValueError(
+                f"Component type must match pattern a2ui.ComponentName (PascalCase), got: {v}"
+            )
         return v
 
     @field_validator('id')
@@ -173,7 +182,8 @@ class A2UIComponent(BaseModel):
 
 
 # Component type registry - maps component types to validation rules
-VALID_COMPONENT_TYPES = {
+# (interned, since every component and lookup table carries these strings)
+VALID_COMPONENT_TYPES = frozenset(sys.intern(component_type) for component_type in {
     # News & Trends
     "a2ui.HeadlineCard",
     "a2ui.TrendIndicator",
@@ -248,11 +258,27 @@ VALID_COMPONENT_TYPES = {
     "a2ui.CategoryTag",
     "a2ui.StatusIndicator",
     "a2ui.PriorityBadge",
+})
+
+# Registry strings by value, so accepted types can be swapped for the interned copy
+_CANONICAL_COMPONENT_TYPES = {
+    component_type: component_type for component_type in VALID_COMPONENT_TYPES
 }
 
+# Sorted type list for invalid-type error messages
+_VALID_COMPONENT_TYPES_TEXT = ', '.join(sorted(VALID_COMPONENT_TYPES))
+
 
 # ID counter for sequential IDs within a session
-_id_counter = 0
+_id_counter = itertools.count(1)
+
+
+@lru_cache(maxsize=128)
+def _type_to_kebab(component_type: str) -> str:
+    """Convert an A2UI type to its kebab-case ID prefix (a2ui.StatCard -> stat-card)."""
+    name = component_type[5:]  # Remove "a2ui."
+    # Insert hyphens before capital letters and convert to lowercase
+    return ''.join(['-' + c.lower() if c.isupper() else c for c in name]).lstrip('-')
 
 
 def generate_id(component_type: str, prefix: str | None = None) -> str:
@@ -282,19 +308,14 @@ def generate_id(component_type: str, prefix: str | None = None) -> str:
         >>> generate_id("a2ui.Section", "intro")
         "intro-1"
     """
-    global _id_counter
-    _id_counter += 1
+    counter = next(_id_counter)
 
     if prefix:
-        return f"{prefix}-{_id_counter}"
+        return f"{prefix}-{counter}"
 
     # Extract component name from type (a2ui.StatCard -> stat-card)
     if component_type.startswith("a2ui."):
-        # Convert PascalCase to kebab-case
-        name = component_type[5:]  # Remove "a2ui."
-        # Insert hyphens before capital letters and convert to lowercase
-        kebab_name = ''.join(['-' + c.lower() if c.isupper() else c for c in name]).lstrip('-')
-        return f"{kebab_name}-{_id_counter}"
+        return f"{_type_to_kebab(component_type)}-{counter}"
 
     # Fallback to UUID
     return f"component-{uuid.uuid4().hex[:8]}"
@@ -308,7 +329,58 @@ def reset_id_counter():
     This ensures IDs start from 1 again.
     """
     global _id_counter
-    _id_counter = 0
+    _id_counter = itertools.count(1)
+
+
+# Trusted fast-build helpers (see _build_trusted_component). The fields-set
+# constants match what validation records for each caller's keyword arguments.
+_GENERATE_FIELDS_SET = frozenset({"type", "id", "props", "children", "layout"})
+_BATCH_FIELDS_SET = frozenset({"type", "id", "props"})
+_new_component = A2UIComponent.__new__
+_set_attribute = object.__setattr__
+
+
+def _is_trusted_props(props: Any) -> bool:
+    """Check that props is a plain dict with str keys, i.e. valid dict[str, Any] as-is."""
+    return type(props) is dict and all(type(key) is str for key in props)
+
+
+def _build_trusted_component(
+    component_type: str,
+    component_id: str,
+    props: dict[str, Any],
+    fields_set: frozenset[str]
+) -> A2UIComponent:
+    """
+    Build an A2UIComponent from values already known to be valid, skipping validation.
+
+    Only for a registry type, a generated ID and props passing _is_trusted_props.
+    Mirrors what validation would store (including the shallow props copy and
+    the fields set). Used instead of model_construct, which is slower than
+    validating in Pydantic v2. Relies on Pydantic v2's instance layout, hence
+    the <3 pin on pydantic.
+    """
+    component = _new_component(A2UIComponent)
+    _set_attribute(component, "__dict__", {
+        "type": component_type,
+        "id": component_id,
+        "props": dict(props),
+        "children": None,
+        "layout": None,
+        "zone": None,
+    })
+    _set_attribute(component, "__pydantic_fields_set__", set(fields_set))
+    _set_attribute(component, "__pydantic_extra__", None)
+    _set_attribute(component, "__pydantic_private__", None)
+    return component
+
+
+def _invalid_component_type_error(component_type: str) -> ValueError:
+    """Build the error raised for a component type missing from the registry."""
+    return ValueError(
+        f"Invalid component type: {component_type}. "
+        f"Must be one of: {_VALID_COMPONENT_TYPES_TEXT}"
+    )
 
 
 def generate_component(
@@ -349,17 +421,22 @@ def generate_component(
         >>> component.id
         "stat-card-1"
     """
-    # Validate component type
-    if component_type not in VALID_COMPONENT_TYPES:
-        raise ValueError(
-            f"Invalid component type: {component_type}. "
-            f"Must be one of: {', '.join(sorted(VALID_COMPONENT_TYPES))}"
-        )
+    # Validate component type (and switch to the registry's interned string)
+    canonical_type = _CANONICAL_COMPONENT_TYPES.get(component_type)
+    if canonical_type is None:
+        raise _invalid_component_type_error(component_type)
+    component_type = canonical_type
 
     # Generate ID if not provided
     if component_id is None:
         component_id = generate_id(component_type)
 
+        # Type and ID are known good; plain components skip model validation
+        if children is None and layout is None and _is_trusted_props(props):
+            return _build_trusted_component(
+                component_type, component_id, props, _GENERATE_FIELDS_SET
+            )
+
     # Create and validate component
     component = A2UIComponent(
         type=component_type,
@@ -372,10 +449,57 @@ def generate_component(
     return component
 
 
+# Pre-encoded '{"type":"a2ui.X","id":' prefix for every registered type
+_TYPE_PREFIX = {
+    component_type: b'{"type":' + orjson.dumps(component_type) + b',"id":'
+    for component_type in VALID_COMPONENT_TYPES
+}
+
+# Optional component fields with their pre-encoded JSON keys, in model field order
+_OPTIONAL_FIELD_KEYS = tuple(
+    (name, b',"' + name.encode() + b'":') for name in ("children", "layout", "zone")
+)
+
+
+def _encode_component(component: A2UIComponent) -> bytes:
+    """
+    Encode a component as JSON without going through model_dump.
+
+    Produces the same bytes as orjson.dumps(component.model_dump(exclude_none=True))
+    by writing the fields directly; props holding values orjson can't encode
+    (e.g. nested models, integers beyond 64 bits) fall back to model_dump and
+    the stdlib json encoder.
+    """
+    try:
+        prefix = _TYPE_PREFIX.get(component.type)
+        if prefix is None:
+            prefix = b'{"type":' + orjson.dumps(component.type) + b',"id":'
+        parts = [
+            prefix, orjson.dumps(component.id),
+            b',"props":', orjson.dumps(component.props),
+        ]
+        for name, key in _OPTIONAL_FIELD_KEYS:
+            value = getattr(component, name)
+            if value is not None:
+                parts.append(key)
+                parts.append(orjson.dumps(value))
+    except TypeError:
+        # orjson rejects ints beyond 64 bits and non-str dict keys; the stdlib
+        # encoder handles both
+        return json.dumps(
+            component.model_dump(exclude_none=True),
+            separators=(",", ":"),
+            ensure_ascii=False
+        ).encode()
+    parts.append(b"}")
+    return b"".join(parts)
+
+
 async def emit_components(
     components: list[A2UIComponent],
-    stream_format: str = "ag-ui"
-) -> AsyncGenerator[str, None]:
+    stream_format: str = "ag-ui",
+    chunk_size: int = 1
+) -> AsyncGenerator[bytes, None]:
     """
     Emit A2UI components in AG-UI streaming format.
 
@@ -389,12 +513,20 @@ async def emit_components(
     - Events separated by double newlines
     - Compatible with EventSource API on frontend
 
+    With chunk_size > 1, up to chunk_size consecutive events are yielded
+    together as one chunk. Each event keeps its own framing, so the stream
+    content is identical; only the number of writes changes.
+
     Args:
         components: List of A2UIComponent instances to emit
         stream_format: Output format ("ag-ui" for SSE, "json" for plain JSON)
+        chunk_size: Number of events per yielded chunk (default 1)
 
     Yields:
-        Formatted event strings ready for SSE streaming
+        UTF-8 encoded events, framed and ready to write to the SSE stream
+
+    Raises:
+        ValueError: If stream_format is unknown or chunk_size is less than 1
 
     Examples:
         >>> components = [
@@ -403,24 +535,48 @@ async def emit_components(
         ... ]
         >>> async for event in emit_components(components):
         ...     print(event)
-        data: {"type": "a2ui.StatCard", "id": "stat-card-1", ...}
-
-        data: {"type": "a2ui.StatCard", "id": "stat-card-2", ...}
+        b'data: {"type":"a2ui.StatCard","id":"stat-card-1",...}\n\n'
+        b'data: {"type":"a2ui.StatCard","id":"stat-card-2",...}\n\n'
     """
-    for component in components:
-        # Convert component to dict for JSON serialization
-        component_dict = component.model_dump(exclude_none=True)
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got: {chunk_size}")
 
+    batch = []
+    for component in components:
         if stream_format == "ag-ui":
             # AG-UI SSE format: "data: {json}\n\n"
-            json_str = json.dumps(component_dict)
-            yield f"data: {json_str}\n\n"
+            event = b"data: " + _encode_component(component) + b"\n\n"
         elif stream_format == "json":
             # Plain JSON (for testing or alternative protocols)
-            yield json.dumps(component_dict) + "\n"
+            event = _encode_component(component) + b"\n"
         else:
             raise ValueError(f"Unknown stream format: {stream_format}")
 
+        if chunk_size == 1:
+            yield event
+            continue
+
+        batch.append(event)
+        if len(batch) == chunk_size:
+            yield b"".join(batch)
+            batch = []
+
+    if batch:
+        yield b"".join(batch)
+
+
+# Required props for common components (read-only)
+_REQUIRED_PROPS = MappingProxyType({
+    "a2ui.StatCard": ("value", "label"),
+    "a2ui.VideoCard": ("videoId", "platform"),
+    "a2ui.HeadlineCard": ("title",),
+    "a2ui.RankedItem": ("rank", "title"),
+    "a2ui.CodeBlock": ("code", "language"),
+    "a2ui.Section": ("title",),
+    "a2ui.Grid": ("columns",),
+    "a2ui.TLDR": ("summary",),
+})
+
 
 def validate_component_props(component_type: str, props: dict[str, Any]) -> bool:
     """
@@ -442,20 +598,9 @@ def validate_component_props(component_type: str, props: dict[str, Any]) -> bool
     Raises:
         ValueError: If required props are missing
     """
-    # Define required props for common components
-    required_props = {
-        "a2ui.StatCard": ["value", "label"],
-        "a2ui.VideoCard": ["videoId", "platform"],
-        "a2ui.HeadlineCard": ["title"],
-        "a2ui.RankedItem": ["rank", "title"],
-        "a2ui.CodeBlock": ["code", "language"],
-        "a2ui.Section": ["title"],
-        "a2ui.Grid": ["columns"],
-        "a2ui.TLDR": ["summary"],
-    }
-
-    if component_type in required_props:
-        missing = [prop for prop in required_props[component_type] if prop not in props]
+    required = _REQUIRED_PROPS.get(component_type)
+    if required is not None:
+        missing = [prop for prop in required if prop not in props]
         if missing:
             raise ValueError(
                 f"{component_type} missing required props: {', '.join(missing)}"
@@ -472,7 +617,8 @@ def generate_components_batch(
     Generate multiple components from specifications.
 
     Convenience function for creating many components at once from a list
-    of (type, props) tuples.
+    of (type, props) tuples. All types are checked before any component is
+    built (or any ID consumed), then components are built in one pass.
 
     Args:
         component_specs: List of (component_type, props) tuples
@@ -480,6 +626,9 @@ def generate_components_batch(
     Returns:
         List of generated A2UIComponent instances
 
+    Raises:
+        ValueError: If any component_type is not valid
+
     Examples:
         >>> specs = [
         ...     ("a2ui.StatCard", {"value": "100", "label": "Users"}),
@@ -490,10 +639,24 @@ def generate_components_batch(
         >>> len(components)
         3
     """
+    canonical_types = _CANONICAL_COMPONENT_TYPES
+    for component_type, _ in component_specs:
+        if component_type not in canonical_types:
+            raise _invalid_component_type_error(component_type)
+
+    # Registry types all start with "a2ui.", so IDs always take the kebab form;
+    # plain str-keyed dict props take the trusted fast build
+    next_id = _id_counter.__next__
+    type_to_kebab = _type_to_kebab
+    build_trusted = _build_trusted_component
     components = []
     for component_type, props in component_specs:
-        component = generate_component(component_type, props)
-        components.append(component)
+        component_type = canonical_types[component_type]
+        component_id = f"{type_to_kebab(component_type)}-{next_id()}"
+        if _is_trusted_props(props):
+            components.append(build_trusted(component_type, component_id, props, _BATCH_FIELDS_SET))
+        else:
+            components.append(A2UIComponent(type=component_type, id=component_id, props=props))
     return components
 
 
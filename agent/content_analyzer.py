@@ -6,6 +6,10 @@ extracting structured information, links, code blocks, tables, and entities.
 """
 
 import re
+import sys
+import copy
+import hashlib
+from collections import OrderedDict
 from typing import Any
 from pydantic import BaseModel, Field
 
@@ -61,6 +65,29 @@ class ContentAnalysis(BaseModel):
         description="Extracted entities (technologies, tools, concepts, etc.)"
     )
 
+    # Structural counts used by layout selection. They are properties rather
+    # than model fields, so dumps are unchanged and they track field updates.
+
+    @property
+    def code_count(self) -> int:
+        """Number of extracted code blocks."""
+        return len(self.code_blocks)
+
+    @property
+    def table_count(self) -> int:
+        """Number of extracted tables."""
+        return len(self.tables)
+
+    @property
+    def media_count(self) -> int:
+        """Number of YouTube and GitHub links."""
+        return len(self.youtube_links) + len(self.github_links)
+
+    @property
+    def section_count(self) -> int:
+        """Number of extracted sections."""
+        return len(self.sections)
+
 
 # Comprehensive regex patterns for link extraction
 # Note: YouTube video IDs are typically 11 characters, but we allow 10-13 for edge cases
@@ -82,6 +109,13 @@ GITHUB_LINK_REGEX = re.compile(
     re.IGNORECASE
 )
 
+# YouTube and GitHub patterns combined so both link kinds are found in one scan;
+# match.lastgroup tells which kind matched
+MEDIA_LINK_REGEX = re.compile(
+    f'(?P<youtube>{YOUTUBE_LINK_REGEX.pattern})|(?P<github>{GITHUB_LINK_REGEX.pattern})',
+    re.IGNORECASE
+)
+
 # Generic URL regex for all links
 URL_REGEX = re.compile(
     r'(?:https?://|www\.)[^\s)\]]+',
@@ -94,11 +128,33 @@ MARKDOWN_LINK_REGEX = re.compile(
     re.IGNORECASE
 )
 
+# Markdown structure patterns used by parse_markdown
+TITLE_REGEX = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+
+HEADER_REGEX = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
+
+CODE_BLOCK_REGEX = re.compile(r'```(\w*)\n(.*?)```', re.DOTALL)
+
+# Simple table detection: lines with | separators
+TABLE_REGEX = re.compile(
+    r'(\|.+\|[\r\n]+\|[-:\s|]+\|[\r\n]+(?:\|.+\|[\r\n]+)*)',
+    re.MULTILINE
+)
+
+
+# Parsed results keyed by content digest; the same document is parsed several
+# times per dashboard request (agent tool, orchestrator, heuristic fallback)
+PARSE_CACHE_MAX_SIZE = 256
+_parse_cache: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+
 
 def parse_markdown(content: str) -> dict[str, Any]:
     """
     Parse Markdown content to extract structural elements.
 
+    Results are cached by a digest of the content (bounded LRU), and each call
+    returns its own copy so callers may freely modify the result.
+
     Extracts sections (headers), links, code blocks, and tables using
     regex patterns and Markdown syntax rules.
 
@@ -115,6 +171,21 @@ def parse_markdown(content: str) -> dict[str, Any]:
         - code_blocks: List of code block dictionaries
         - tables: List of table dictionaries
     """
+    key = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    cached = _parse_cache.get(key)
+    if cached is None:
+        cached = _parse_markdown_uncached(content)
+        _parse_cache[key] = cached
+        if len(_parse_cache) > PARSE_CACHE_MAX_SIZE:
+            _parse_cache.popitem(last=False)
+    else:
+        _parse_cache.move_to_end(key)
+
+    return copy.deepcopy(cached)
+
+
+def _parse_markdown_uncached(content: str) -> dict[str, Any]:
+    """Parse Markdown content without consulting the cache (see parse_markdown)."""
     result = {
         'title': '',
         'sections': [],
@@ -126,61 +197,52 @@ def parse_markdown(content: str) -> dict[str, Any]:
     }
 
     # Extract title (first H1 header)
-    title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+    title_match = TITLE_REGEX.search(content)
     if title_match:
         result['title'] = title_match.group(1).strip()
     else:
-        # Fallback: use first line or "Untitled"
-        first_line = content.split('\n')[0].strip() if content else ''
+        # Fallback: use first line or "Untitled" (slice it out rather than
+        # splitting the whole document into lines)
+        newline_index = content.find('\n')
+        first_line = (content if newline_index == -1 else content[:newline_index]).strip()
         result['title'] = first_line[:100] if first_line else 'Untitled Document'
 
     # Extract all headers (sections)
-    header_pattern = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
-    headers = header_pattern.findall(content)
+    headers = HEADER_REGEX.findall(content)
     result['sections'] = [header[1].strip() for header in headers]
 
     # Extract all links (from Markdown syntax [text](url))
-    markdown_links = MARKDOWN_LINK_REGEX.findall(content)
-    for text, url in markdown_links:
-        result['all_links'].append(url.strip())
-
-    # Also extract plain URLs in text
-    plain_urls = URL_REGEX.findall(content)
-    for url in plain_urls:
-        cleaned_url = url.strip()
-        if cleaned_url not in result['all_links']:
-            result['all_links'].append(cleaned_url)
-
-    # Extract YouTube links
-    youtube_matches = YOUTUBE_LINK_REGEX.finditer(content)
-    for match in youtube_matches:
-        youtube_url = match.group(0)
-        if youtube_url not in result['youtube_links']:
-            result['youtube_links'].append(youtube_url)
-
-    # Extract GitHub links
-    github_matches = GITHUB_LINK_REGEX.finditer(content)
-    for match in github_matches:
-        github_url = match.group(0)
-        if github_url not in result['github_links']:
-            result['github_links'].append(github_url)
+    all_links = result['all_links']
+    all_links.extend(match.group(2).strip() for match in MARKDOWN_LINK_REGEX.finditer(content))
+
+    # Also extract plain URLs in text, skipping any already collected
+    seen_links = set(all_links)
+    for match in URL_REGEX.finditer(content):
+        cleaned_url = match.group(0).strip()
+        if cleaned_url not in seen_links:
+            seen_links.add(cleaned_url)
+            all_links.append(cleaned_url)
+
+    # Extract YouTube and GitHub links in a single pass
+    media_links = {'youtube': result['youtube_links'], 'github': result['github_links']}
+    seen_media = set()
+    for match in MEDIA_LINK_REGEX.finditer(content):
+        media_url = match.group(0)
+        if media_url not in seen_media:
+            seen_media.add(media_url)
+            media_links[match.lastgroup].append(media_url)
 
     # Extract code blocks with language specification
-    code_block_pattern = re.compile(r'```(\w*)\n(.*?)```', re.DOTALL)
-    code_matches = code_block_pattern.findall(content)
+    # Language names repeat across blocks and cached documents, so intern them
+    code_matches = CODE_BLOCK_REGEX.findall(content)
     for language, code in code_matches:
         result['code_blocks'].append({
-            'language': language.strip() if language else 'text',
+            'language': sys.intern(language.strip()) if language else 'text',
             'code': code.strip()
         })
 
     # Extract tables (Markdown table syntax)
-    # Simple table detection: lines with | separators
-    table_pattern = re.compile(
-        r'(\|.+\|[\r\n]+\|[-:\s|]+\|[\r\n]+(?:\|.+\|[\r\n]+)*)',
-        re.MULTILINE
-    )
-    table_matches = table_pattern.findall(content)
+    table_matches = TABLE_REGEX.findall(content)
 
     for table_text in table_matches:
         lines = [line.strip() for line in table_text.strip().split('\n') if line.strip()]
@@ -288,6 +350,12 @@ async def analyze_content(markdown: str, agent) -> ContentAnalysis:
     return analysis
 
 
+# Keyword indicators for heuristic classification, checked in priority order
+TUTORIAL_KEYWORDS = ('step', 'tutorial', 'how to', 'guide', 'lesson', 'walkthrough')
+RESEARCH_KEYWORDS = ('abstract', 'methodology', 'results', 'conclusion', 'references', 'citation')
+TECH_DOC_KEYWORDS = ('api', 'endpoint', 'parameter', 'function', 'class', 'method')
+
+
 def _classify_heuristic(markdown: str, parsed: dict[str, Any]) -> str:
     """
     Heuristic-based document classification fallback.
@@ -305,18 +373,17 @@ def _classify_heuristic(markdown: str, parsed: dict[str, Any]) -> str:
     content_lower = markdown.lower()
 
     # Check for tutorial indicators
-    tutorial_keywords = ['step', 'tutorial', 'how to', 'guide', 'lesson', 'walkthrough']
-    if any(keyword in content_lower for keyword in tutorial_keywords):
+    if any(keyword in content_lower for keyword in TUTORIAL_KEYWORDS):
         return 'tutorial'
 
     # Check for research indicators
-    research_keywords = ['abstract', 'methodology', 'results', 'conclusion', 'references', 'citation']
-    if any(keyword in content_lower for keyword in research_keywords):
+    if any(keyword in content_lower for keyword in RESEARCH_KEYWORDS):
         return 'research'
 
-    # Check for technical documentation
-    tech_doc_keywords = ['api', 'endpoint', 'parameter', 'function', 'class', 'method']
-    if any(keyword in content_lower for keyword in tech_doc_keywords) and len(parsed['code_blocks']) >= 2:
+    # Check for technical documentation (cheap code block check first)
+    if len(parsed['code_blocks']) >= 2 and any(
+        keyword in content_lower for keyword in TECH_DOC_KEYWORDS
+    ):
         return 'technical_doc'
 
     # Check for code-heavy content (guides)
@@ -75,11 +75,63 @@ LAYOUT_MAPPINGS = {
 }
 
 
+# Top 3 alternative layouts per document type (every other mapping, in order)
+_ALTERNATIVE_LAYOUTS = {
+    doc_type: tuple(
+        layout_info['layout']
+        for other_type, layout_info in LAYOUT_MAPPINGS.items()
+        if other_type != doc_type
+    )[:3]
+    for doc_type in LAYOUT_MAPPINGS
+}
+
+# Component suggestions by layout (first mapping wins for shared layouts)
+_COMPONENTS_BY_LAYOUT = {}
+for _layout_info in LAYOUT_MAPPINGS.values():
+    _COMPONENTS_BY_LAYOUT.setdefault(_layout_info['layout'], tuple(_layout_info['components']))
+del _layout_info
+
+
+# Rule-based selection table, checked in order; the first rule whose count
+# exceeds its threshold wins. Fields: ContentAnalysis count attribute,
+# threshold, layout, confidence, reasoning template, alternatives, components.
+_RULES = (
+    # Rule 1: Code-heavy content → instructional layout
+    (
+        'code_count', 5, 'instructional_layout', 0.9,
+        'High code block count ({count}) indicates tutorial/instructional content',
+        ('reference_layout', 'list_layout'),
+        ('CodeBlock', 'StepList', 'ProgressTracker', 'Highlight', 'CollapsibleSection'),
+    ),
+    # Rule 2: Table-heavy content → data layout
+    (
+        'table_count', 2, 'data_layout', 0.85,
+        'High table count ({count}) indicates data/research content',
+        ('reference_layout', 'summary_layout'),
+        ('DataTable', 'StatCard', 'ComparisonChart', 'Citation', 'Graph'),
+    ),
+    # Rule 3: Media-rich content → media layout
+    (
+        'media_count', 3, 'media_layout', 0.88,
+        'High media link count ({count}) indicates visual/overview content',
+        ('news_layout', 'summary_layout'),
+        ('Hero', 'MediaEmbed', 'Highlight', 'Card', 'Timeline'),
+    ),
+    # Rule 4: Many sections → reference layout
+    (
+        'section_count', 10, 'reference_layout', 0.82,
+        'High section count ({count}) indicates technical documentation',
+        ('list_layout', 'instructional_layout'),
+        ('CodeBlock', 'ApiTable', 'TabbedContent', 'SideNav', 'SearchBar'),
+    ),
+)
+
+
 def _apply_rule_based_selection(content_analysis: ContentAnalysis) -> LayoutDecision | None:
     """
     Apply rule-based logic to select a layout based on content metrics.
 
-    Fast, deterministic selection using structural analysis:
+    Fast, deterministic selection using structural analysis (see _RULES):
     - Code block count (>5 → instructional)
     - Table count (>2 → data)
     - Media links (>3 → media)
@@ -92,50 +144,16 @@ def _apply_rule_based_selection(content_analysis: ContentAnalysis) -> LayoutDeci
     Returns:
         LayoutDecision if a rule matches, None otherwise
     """
-    code_block_count = len(content_analysis.code_blocks)
-    table_count = len(content_analysis.tables)
-    media_count = len(content_analysis.youtube_links) + len(content_analysis.github_links)
-    section_count = len(content_analysis.sections)
-
-    # Rule 1: Code-heavy content → instructional layout
-    if code_block_count > 5:
-        return LayoutDecision(
-            layout_type='instructional_layout',
-            confidence=0.9,
-            reasoning=f'High code block count ({code_block_count}) indicates tutorial/instructional content',
-            alternative_layouts=['reference_layout', 'list_layout'],
-            component_suggestions=['CodeBlock', 'StepList', 'ProgressTracker', 'Highlight', 'CollapsibleSection']
-        )
-
-    # Rule 2: Table-heavy content → data layout
-    if table_count > 2:
-        return LayoutDecision(
-            layout_type='data_layout',
-            confidence=0.85,
-            reasoning=f'High table count ({table_count}) indicates data/research content',
-            alternative_layouts=['reference_layout', 'summary_layout'],
-            component_suggestions=['DataTable', 'StatCard', 'ComparisonChart', 'Citation', 'Graph']
-        )
-
-    # Rule 3: Media-rich content → media layout
-    if media_count > 3:
-        return LayoutDecision(
-            layout_type='media_layout',
-            confidence=0.88,
-            reasoning=f'High media link count ({media_count}) indicates visual/overview content',
-            alternative_layouts=['news_layout', 'summary_layout'],
-            component_suggestions=['Hero', 'MediaEmbed', 'Highlight', 'Card', 'Timeline']
-        )
-
-    # Rule 4: Many sections → reference layout
-    if section_count > 10:
-        return LayoutDecision(
-            layout_type='reference_layout',
-            confidence=0.82,
-            reasoning=f'High section count ({section_count}) indicates technical documentation',
-            alternative_layouts=['list_layout', 'instructional_layout'],
-            component_suggestions=['CodeBlock', 'ApiTable', 'TabbedContent', 'SideNav', 'SearchBar']
-        )
+    for count_name, threshold, layout, confidence, reasoning, alternatives, components in _RULES:
+        count = getattr(content_analysis, count_name)
+        if count > threshold:
+            return LayoutDecision(
+                layout_type=layout,
+                confidence=confidence,
+                reasoning=reasoning.format(count=count),
+                alternative_layouts=list(alternatives),
+                component_suggestions=list(components)
+            )
 
     # No rule matched
     return None
@@ -158,18 +176,11 @@ def _get_layout_from_document_type(content_analysis: ContentAnalysis) -> LayoutD
     mapping = LAYOUT_MAPPINGS.get(doc_type)
 
     if mapping:
-        # Find alternative layouts (exclude the selected one)
-        alternatives = [
-            layout_info['layout']
-            for dt, layout_info in LAYOUT_MAPPINGS.items()
-            if dt != doc_type
-        ][:3]  # Top 3 alternatives
-
         return LayoutDecision(
             layout_type=mapping['layout'],
             confidence=0.75,
             reasoning=f"Document classified as '{doc_type}', mapped to {mapping['layout']}",
-            alternative_layouts=alternatives,
+            alternative_layouts=list(_ALTERNATIVE_LAYOUTS[doc_type]),
             component_suggestions=mapping['components']
         )
 
@@ -206,9 +217,9 @@ async def _select_layout_with_llm(content_analysis: ContentAnalysis, agent) -> L
     Content characteristics:
     - Document type: {content_analysis.document_type}
     - Title: {content_analysis.title}
-    - Sections: {len(content_analysis.sections)} ({', '.join(content_analysis.sections[:5])})
-    - Code blocks: {len(content_analysis.code_blocks)}
-    - Tables: {len(content_analysis.tables)}
+    - Sections: {content_analysis.section_count} ({', '.join(content_analysis.sections[:5])})
+    - Code blocks: {content_analysis.code_count}
+    - Tables: {content_analysis.table_count}
     - Links: {len(content_analysis.links)}
     - YouTube links: {len(content_analysis.youtube_links)}
     - GitHub links: {len(content_analysis.github_links)}
@@ -266,11 +277,7 @@ async def _select_layout_with_llm(content_analysis: ContentAnalysis, agent) -> L
             alternatives = [alt.strip() for alt in alt_text.split(',')]
 
         # Get component suggestions from mapping
-        components = []
-        for doc_type, mapping in LAYOUT_MAPPINGS.items():
-            if mapping['layout'] == layout_type:
-                components = mapping['components']
-                break
+        components = list(_COMPONENTS_BY_LAYOUT.get(layout_type, ()))
 
         return LayoutDecision(
             layout_type=layout_type,
@@ -9,8 +9,11 @@ on the content analysis.
 import os
 import json
 import re
+import asyncio
+import hashlib
 from typing import AsyncGenerator
 import httpx
+import orjson
 from dotenv import load_dotenv
 
 from a2ui_generator import (
@@ -69,6 +72,27 @@ OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 OPENROUTER_MODEL = os.getenv("OPENROUTER_MODEL", "anthropic/claude-haiku-4.5")
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
+# Request fields that are identical for every call, serialized once at import
+_REQUEST_BODY_PREFIX = b'{"model":' + orjson.dumps(OPENROUTER_MODEL) + b","
+_REQUEST_HEADERS = {
+    "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+    "Content-Type": "application/json",
+    "HTTP-Referer": "http://localhost:3010",
+    "X-Title": "Second Brain Research Dashboard",
+}
+
+# Shared HTTP client so the OpenRouter connection (and TLS session) is reused across calls
+_llm_client: httpx.AsyncClient | None = None
+
+# Startup warm-up GET timeout (seconds), well below the client's 120s default so a
+# slow or unreachable OpenRouter can't hold up startup
+WARM_UP_TIMEOUT_SECONDS = 5.0
+
+# In-flight LLM requests keyed by request body digest, so identical concurrent
+# calls share a single HTTP round trip. Each entry is [task, waiter count]; the
+# request is cancelled once every waiter has been cancelled.
+_INFLIGHT_REQUESTS: dict[bytes, list] = {}
+
 # Default semantic zones for each component type
 # These are used when the LLM doesn't specify a zone
 COMPONENT_DEFAULT_ZONES = {
@@ -183,6 +207,88 @@ COMPONENT_DEFAULT_WIDTHS = {
     "TimelineEvent": "full",
 }
 
+# Case-insensitive type mapping for robust LLM output handling
+# Maps lowercase versions to canonical PascalCase names
+COMPONENT_TYPE_CANONICAL = {
+    "tldr": "TLDR",
+    "keytakeaways": "KeyTakeaways",
+    "statcard": "StatCard",
+    "codeblock": "CodeBlock",
+    "stepcard": "StepCard",
+    "calloutcard": "CalloutCard",
+    "videocard": "VideoCard",
+    "repocard": "RepoCard",
+    "linkcard": "LinkCard",
+    "datatable": "DataTable",
+    "headlinecard": "HeadlineCard",
+    "tableofcontents": "TableOfContents",
+    "quotecard": "QuoteCard",
+    "checklistitem": "ChecklistItem",
+    "bulletpoint": "BulletPoint",
+    "experttip": "ExpertTip",
+    "badge": "Badge",
+    "tag": "Tag",
+    "section": "Section",
+    "comparisontable": "ComparisonTable",
+    "trendindicator": "TrendIndicator",
+    "metricrow": "MetricRow",
+    "comparisonbar": "ComparisonBar",
+    "rankeditem": "RankedItem",
+    "proconitem": "ProConItem",
+    "accordion": "Accordion",
+    "executivesummary": "ExecutiveSummary",
+    "grid": "Grid",
+    "toolcard": "ToolCard",
+    "bookcard": "BookCard",
+    "taggroup": "TagGroup",
+    "tagcloud": "TagCloud",
+    "categorybadge": "CategoryBadge",
+    "statusindicator": "StatusIndicator",
+    "prioritybadge": "PriorityBadge",
+    "difficultybadge": "DifficultyBadge",
+    "profilecard": "ProfileCard",
+    "companycard": "CompanyCard",
+    "timelineevent": "TimelineEvent",
+}
+
+# Canonical PascalCase names, used to detect unknown types without scanning the dict
+CANONICAL_COMPONENT_TYPES = frozenset(COMPONENT_TYPE_CANONICAL.values())
+
+
+def _get_llm_client() -> httpx.AsyncClient:
+    """Return the shared OpenRouter client, creating it on first use."""
+    global _llm_client
+    if _llm_client is None or _llm_client.is_closed:
+        _llm_client = httpx.AsyncClient(timeout=120.0)
+    return _llm_client
+
+
+async def warm_up_llm_client() -> None:
+    """
+    Open the OpenRouter connection ahead of the first dashboard request.
+
+    Performs a lightweight GET so DNS, TCP and TLS setup happen at startup
+    instead of on the critical path of the first LLM call. The GET gives up
+    after WARM_UP_TIMEOUT_SECONDS; a failed warm-up is only logged.
+    """
+    try:
+        response = await _get_llm_client().get(
+            f"{OPENROUTER_BASE_URL}/models",
+            headers=_REQUEST_HEADERS,
+            timeout=WARM_UP_TIMEOUT_SECONDS,
+        )
+        print(f"[LLM] Connection warmed (status {response.status_code})")
+    except httpx.HTTPError as e:
+        print(f"[LLM] Connection warm-up failed: {e}")
+
+
+async def close_llm_client() -> None:
+    """Close the shared OpenRouter client."""
+    global _llm_client
+    if _llm_client is not None:
+        await _llm_client.aclose()
+        _llm_client = None
+
 
 async def call_llm(prompt: str, system_prompt: str = "", max_tokens: int = 4000, temperature: float = 0.7) -> str:
     """
@@ -205,30 +311,68 @@ async def call_llm(prompt: str, system_prompt: str = "", max_tokens: int = 4000,
         messages.append({"role": "system", "content": system_prompt})
     messages.append({"role": "user", "content": prompt})
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        response = await client.post(
-            f"{OPENROUTER_BASE_URL}/chat/completions",
-            headers={
-                "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "http://localhost:3010",
-                "X-Title": "Second Brain Research Dashboard",
-            },
-            json={
-                "model": OPENROUTER_MODEL,
-                "messages": messages,
-                "temperature": temperature,
-                "max_tokens": max_tokens,
-            }
-        )
+    # Splice the per-call fields onto the pre-serialized prefix (dropping their opening brace)
+    body = _REQUEST_BODY_PREFIX + orjson.dumps({
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    })[1:]
+
+    key = hashlib.blake2b(body, digest_size=16).digest()
+    entry = _INFLIGHT_REQUESTS.get(key)
+    if entry is None:
+        task = asyncio.ensure_future(_post_chat_completion(body))
+        entry = [task, 0]
+        _INFLIGHT_REQUESTS[key] = entry
+        task.add_done_callback(lambda done: _release_inflight_request(key, done))
+    else:
+        task = entry[0]
+        print("[LLM] Joining identical in-flight request")
+    entry[1] += 1
+
+    # Shield so a cancelled caller doesn't cancel the request for the others;
+    # the last waiter to be cancelled cancels the request itself
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        entry[1] -= 1
+        if entry[1] == 0 and not task.done():
+            task.cancel()
+            if _INFLIGHT_REQUESTS.get(key) is entry:
+                del _INFLIGHT_REQUESTS[key]
+        raise
 
-        if response.status_code != 200:
-            error_text = response.text
-            print(f"[LLM ERROR] Status {response.status_code}: {error_text}")
-            raise Exception(f"LLM API error: {response.status_code} - {error_text}")
 
-        result = response.json()
-        return result["choices"][0]["message"]["content"]
+def _release_inflight_request(key: bytes, task: asyncio.Task) -> None:
+    """Drop a finished request from the in-flight table (if it's still the registered one)."""
+    entry = _INFLIGHT_REQUESTS.get(key)
+    if entry is not None and entry[0] is task:
+        del _INFLIGHT_REQUESTS[key]
+
+
+async def _post_chat_completion(body: bytes) -> str:
+    """
+    POST a serialized chat-completions body to OpenRouter.
+
+    Args:
+        body: JSON request body
+
+    Returns:
+        The LLM response text
+    """
+    response = await _get_llm_client().post(
+        f"{OPENROUTER_BASE_URL}/chat/completions",
+        headers=_REQUEST_HEADERS,
+        content=body,
+    )
+
+    if response.status_code != 200:
+        error_text = response.text
+        print(f"[LLM ERROR] Status {response.status_code}: {error_text}")
+        raise Exception(f"LLM API error: {response.status_code} - {error_text}")
+
+    result = response.json()
+    return result["choices"][0]["message"]["content"]
 
 
 def extract_json_from_response(response: str) -> dict:
@@ -599,57 +743,14 @@ def build_a2ui_component(spec: dict, content_analysis: dict) -> A2UIComponent |
     # Normalize component type - strip whitespace
     component_type = component_type.strip()
 
-    # Case-insensitive type mapping for robust LLM output handling
-    # Maps lowercase versions to canonical PascalCase names
-    COMPONENT_TYPE_CANONICAL = {
-        "tldr": "TLDR",
-        "keytakeaways": "KeyTakeaways",
-        "statcard": "StatCard",
-        "codeblock": "CodeBlock",
-        "stepcard": "StepCard",
-        "calloutcard": "CalloutCard",
-        "videocard": "VideoCard",
-        "repocard": "RepoCard",
-        "linkcard": "LinkCard",
-        "datatable": "DataTable",
-        "headlinecard": "HeadlineCard",
-        "tableofcontents": "TableOfContents",
-        "quotecard": "QuoteCard",
-        "checklistitem": "ChecklistItem",
-        "bulletpoint": "BulletPoint",
-        "experttip": "ExpertTip",
-        "badge": "Badge",
-        "tag": "Tag",
-        "section": "Section",
-        "comparisontable": "ComparisonTable",
-        "trendindicator": "TrendIndicator",
-        "metricrow": "MetricRow",
-        "comparisonbar": "ComparisonBar",
-        "rankeditem": "RankedItem",
-        "proconitem": "ProConItem",
-        "accordion": "Accordion",
-        "executivesummary": "ExecutiveSummary",
-        "grid": "Grid",
-        "toolcard": "ToolCard",
-        "bookcard": "BookCard",
-        "taggroup": "TagGroup",
-        "tagcloud": "TagCloud",
-        "categorybadge": "CategoryBadge",
-        "statusindicator": "StatusIndicator",
-        "prioritybadge": "PriorityBadge",
-        "difficultybadge": "DifficultyBadge",
-        "profilecard": "ProfileCard",
-        "companycard": "CompanyCard",
-        "timelineevent": "TimelineEvent",
-    }
-
     # Try to normalize type (handle various casing from LLM)
     original_type = component_type
-    if component_type.lower() in COMPONENT_TYPE_CANONICAL:
-        component_type = COMPONENT_TYPE_CANONICAL[component_type.lower()]
+    canonical_type = COMPONENT_TYPE_CANONICAL.get(component_type.lower())
+    if canonical_type is not None:
+        component_type = canonical_type
         if original_type != component_type:
             print(f"[BUILD] Normalized component type: '{original_type}' → '{component_type}'")
-    elif component_type and component_type not in COMPONENT_TYPE_CANONICAL.values():
+    elif component_type and component_type not in CANONICAL_COMPONENT_TYPES:
         print(f"[BUILD] Unknown component type: '{component_type}' (will use fallback)")
 
     try:
@@ -7,22 +7,32 @@ for bidirectional state synchronization and streaming agent responses.
 
 import os
 import re
-import json
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables first
 load_dotenv()
 
 from starlette.routing import Route
-from starlette.responses import JSONResponse, StreamingResponse
+from starlette.responses import JSONResponse, Response, StreamingResponse
 from starlette.applications import Starlette
 from starlette.requests import Request
 
 from agent import agent, DashboardState
 from pydantic_ai.ag_ui import StateDeps
+from streaming import coalesce_sse_events
 
 # Configuration
 BACKEND_PORT = int(os.getenv("BACKEND_PORT", "8000"))
+IS_DEVELOPMENT = os.getenv("NODE_ENV", "development") == "development"
+
+# CORS origins (comma-separated), enforced outside development only;
+# development accepts any origin
+ALLOWED_ORIGINS = tuple(dict.fromkeys(
+    origin.strip().lower()
+    for origin in os.getenv("ALLOWED_ORIGINS", "").split(",")
+    if origin.strip()
+))
 
 
 def pascal_to_screaming_snake(name: str) -> str:
@@ -56,10 +66,17 @@ EVENT_TYPE_MAP = {
 }
 
 
-def transform_event_type(event_data: str) -> str:
+# Pre-encoded "event: " lines for the known event types
+EVENT_LINE_MAP = {
+    f"event: {name}".encode(): f"event: {event_type}".encode()
+    for name, event_type in EVENT_TYPE_MAP.items()
+}
+
+
+def transform_event_type(event_data: bytes) -> bytes:
     """Transform event type in SSE data from PascalCase to SCREAMING_SNAKE_CASE."""
     try:
-        data = json.loads(event_data)
+        data = orjson.loads(event_data)
         if "type" in data:
             original_type = data["type"]
             # Check if we have a mapping, otherwise convert dynamically
@@ -68,42 +85,48 @@ def transform_event_type(event_data: str) -> str:
             elif not original_type.isupper():
                 # Dynamically convert if not already SCREAMING_SNAKE_CASE
                 data["type"] = pascal_to_screaming_snake(original_type)
-        return json.dumps(data)
-    except json.JSONDecodeError:
+        return orjson.dumps(data)
+    except orjson.JSONDecodeError:
         return event_data
 
 
 async def transform_sse_stream(original_response):
-    """Transform SSE stream to use SCREAMING_SNAKE_CASE event types."""
+    """
+    Transform SSE stream to use SCREAMING_SNAKE_CASE event types.
+
+    Chunks are processed and yielded as UTF-8 bytes, so StreamingResponse
+    sends them without another encode step.
+    """
     try:
         async for chunk in original_response.body_iterator:
             try:
-                if isinstance(chunk, bytes):
-                    chunk = chunk.decode('utf-8')
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
 
                 # Process each line in the chunk
-                lines = chunk.split('\n')
+                lines = chunk.split(b'\n')
                 transformed_lines = []
 
                 for line in lines:
-                    if line.startswith('event: '):
+                    if line.startswith(b'event: '):
                         # Transform event name
-                        event_name = line[7:]
-                        if event_name in EVENT_TYPE_MAP:
-                            transformed_lines.append(f'event: {EVENT_TYPE_MAP[event_name]}')
-                        elif not event_name.isupper():
-                            transformed_lines.append(f'event: {pascal_to_screaming_snake(event_name)}')
+                        event_line = EVENT_LINE_MAP.get(line)
+                        if event_line is not None:
+                            transformed_lines.append(event_line)
                         else:
-                            transformed_lines.append(line)
-                    elif line.startswith('data: '):
+                            event_name = line[7:].decode('utf-8')
+                            if not event_name.isupper():
+                                event_type = pascal_to_screaming_snake(event_name)
+                                transformed_lines.append(f'event: {event_type}'.encode('utf-8'))
+                            else:
+                                transformed_lines.append(line)
+                    elif line.startswith(b'data: '):
                         # Transform data JSON
-                        data = line[6:]
-                        transformed_data = transform_event_type(data)
-                        transformed_lines.append(f'data: {transformed_data}')
+                        transformed_lines.append(b'data: ' + transform_event_type(line[6:]))
                     else:
                         transformed_lines.append(line)
 
-                yield '\n'.join(transformed_lines)
+                yield b'\n'.join(transformed_lines)
             except Exception as chunk_error:
                 print(f"[SSE ERROR] Error processing chunk: {chunk_error}", flush=True)
                 import traceback
@@ -121,6 +144,16 @@ _base_ag_ui_app = agent.to_ag_ui(
     deps=StateDeps(DashboardState()),
 )
 
+# Resolve the base app's POST handler once instead of scanning routes per request
+_base_ag_ui_endpoint = next(
+    (
+        route.endpoint
+        for route in _base_ag_ui_app.routes
+        if hasattr(route, 'methods') and 'POST' in route.methods
+    ),
+    None,
+)
+
 # Create our wrapper app
 app = Starlette()
 
@@ -135,9 +168,8 @@ async def ag_ui_endpoint(request: Request):
         body = await request.body()
         print(f"[AG-UI] Received request: {len(body)} bytes", flush=True)
 
-        # Create a new request with the body for the base app
-        from starlette.requests import Request as StarletteRequest
-        from starlette.datastructures import Headers
+        if _base_ag_ui_endpoint is None:
+            return JSONResponse({"error": "AG-UI endpoint not found"}, status_code=500)
 
         # We need to recreate the request because we consumed the body
         scope = dict(request.scope)
@@ -145,21 +177,15 @@ async def ag_ui_endpoint(request: Request):
         async def receive():
             return {"type": "http.request", "body": body}
 
-        new_request = StarletteRequest(scope, receive)
+        new_request = Request(scope, receive)
 
         # Get the original response from the base AG-UI app
-        # Find the POST route handler
-        for route in _base_ag_ui_app.routes:
-            if hasattr(route, 'methods') and 'POST' in route.methods:
-                original_response = await route.endpoint(new_request)
-                break
-        else:
-            return JSONResponse({"error": "AG-UI endpoint not found"}, status_code=500)
+        original_response = await _base_ag_ui_endpoint(new_request)
 
         # If it's a streaming response, wrap it with our transformer
         if isinstance(original_response, StreamingResponse):
             return StreamingResponse(
-                transform_sse_stream(original_response),
+                coalesce_sse_events(transform_sse_stream(original_response)),
                 media_type="text/event-stream",
                 headers=dict(original_response.headers),
             )
@@ -183,13 +209,17 @@ async def info_endpoint(request: Request):
     })
 
 
-# Health endpoint
+# Health endpoint bodies, serialized once; the endpoint only picks one
+_HEALTH_READY = orjson.dumps({"status": "healthy", "agent_ready": True})
+_HEALTH_NOT_READY = orjson.dumps({"status": "healthy", "agent_ready": False})
+
+
 async def health_endpoint(request: Request):
     """Health check endpoint."""
-    return JSONResponse({
-        "status": "healthy",
-        "agent_ready": bool(os.getenv("OPENROUTER_API_KEY")),
-    })
+    return Response(
+        _HEALTH_READY if os.getenv("OPENROUTER_API_KEY") else _HEALTH_NOT_READY,
+        media_type="application/json",
+    )
 
 
 # GET handler for root to help with debugging/discovery
@@ -221,12 +251,12 @@ app.routes.append(Route("/info", info_endpoint, methods=["GET"]))
 app.routes.append(Route("/health", health_endpoint, methods=["GET"]))
 
 
-# Add CORS middleware for development
+# Add CORS middleware (any origin in development or when none are configured)
 from starlette.middleware.cors import CORSMiddleware
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=list(ALLOWED_ORIGINS) if ALLOWED_ORIGINS and not IS_DEVELOPMENT else ["*"],
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -241,13 +271,40 @@ async def startup():
     print(f"[*] Info endpoint: GET http://localhost:{BACKEND_PORT}/info")
     print(f"[*] Health endpoint: GET http://localhost:{BACKEND_PORT}/health")
 
+    # The agent tools import these lazily; load them now so the first request
+    # doesn't pay for module import and regex compilation
+    import content_analyzer  # noqa: F401
+    import llm_orchestrator
+
     api_key = os.getenv("OPENROUTER_API_KEY")
     if not api_key:
         print("[!] WARNING: OPENROUTER_API_KEY not set")
     else:
         print("[+] OpenRouter API key configured")
+        await llm_orchestrator.warm_up_llm_client()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Shutdown event handler."""
+    import llm_orchestrator
+
+    await llm_orchestrator.close_llm_client()
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=BACKEND_PORT, reload=True)
+
+    if IS_DEVELOPMENT:
+        uvicorn.run("main:app", host="0.0.0.0", port=BACKEND_PORT, reload=True)
+    else:
+        # Production: no reloader; uvloop/httptools are picked up automatically
+        # when installed (uvicorn[standard])
+        limit_concurrency = os.getenv("UVICORN_LIMIT_CONCURRENCY")
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=BACKEND_PORT,
+            workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+            limit_concurrency=int(limit_concurrency) if limit_concurrency else None,
+        )
@@ -14,6 +14,8 @@ All prompts are designed to work with Pydantic AI's structured output capabiliti
 ensuring type-safe, validated responses.
 """
 
+from functools import lru_cache
+
 # ============================================================================
 # CONTENT ANALYSIS PROMPT
 # ============================================================================
@@ -681,7 +683,7 @@ Component Priorities: {', '.join(suggestions[:15])}
 # VALIDATION FUNCTIONS
 # ============================================================================
 
-def validate_component_variety(components: list[dict]) -> dict:
+def validate_component_variety(components: list[dict], fail_fast: bool = False) -> dict:
     """
     Validate that component selection meets variety requirements.
 
@@ -689,8 +691,15 @@ def validate_component_variety(components: list[dict]) -> dict:
     1. At least 4 different component types
     2. No more than 2 consecutive components of the same type
 
+    Only the sequence of component types affects the result, so results are
+    cached per type sequence (see _validate_component_types).
+
     Args:
         components: List of component specifications
+        fail_fast: Stop scanning once the result is known to be invalid
+            (3+ consecutive of one type with 4+ types already seen). The
+            statistics then only cover the components scanned so far, and
+            the result is not cached.
 
     Returns:
         Dictionary with validation results and statistics
@@ -705,21 +714,52 @@ def validate_component_variety(components: list[dict]) -> dict:
             'violations': ['No components provided']
         }
 
-    # Count unique types
-    component_types = [c.get('component_type', '') for c in components]
-    unique_types = set(component_types)
-    unique_count = len(unique_types)
+    if fail_fast:
+        return _compute_variety(
+            (component.get('component_type', '') for component in components),
+            len(components),
+            fail_fast=True
+        )
+
+    component_types = tuple(component.get('component_type', '') for component in components)
+    result = _validate_component_types(component_types)
+
+    # Copy the mutable parts so callers can't alter the cached result
+    return {
+        **result,
+        'violations': list(result['violations']),
+        'component_type_distribution': dict(result['component_type_distribution'])
+    }
 
-    # Check consecutive same type
-    max_consecutive = 1
-    current_consecutive = 1
 
-    for i in range(1, len(component_types)):
-        if component_types[i] == component_types[i-1]:
+@lru_cache(maxsize=1024)
+def _validate_component_types(component_types: tuple) -> dict:
+    """Cached variety statistics for a non-empty tuple of component types."""
+    return _compute_variety(component_types, len(component_types))
+
+
+def _compute_variety(component_types, total: int, fail_fast: bool = False) -> dict:
+    """Compute variety statistics for a non-empty iterable of component types."""
+    # Single pass: count each type and track the longest run of the same type
+    type_distribution = {}
+    max_consecutive = 0
+    current_consecutive = 0
+    previous_type = None
+
+    for component_type in component_types:
+        type_distribution[component_type] = type_distribution.get(component_type, 0) + 1
+
+        if component_type == previous_type:
             current_consecutive += 1
-            max_consecutive = max(max_consecutive, current_consecutive)
         else:
             current_consecutive = 1
+            previous_type = component_type
+        if current_consecutive > max_consecutive:
+            max_consecutive = current_consecutive
+        if fail_fast and max_consecutive > 2 and len(type_distribution) >= 4:
+            break
+
+    unique_count = len(type_distribution)
 
     # Validation checks
     meets_min_types = unique_count >= 4
@@ -732,15 +772,14 @@ def validate_component_variety(components: list[dict]) -> dict:
         violations.append(f'Found {max_consecutive} consecutive same type, max allowed is 2')
 
     # Check for type dominance (no single type should be >40% of components)
-    type_distribution = {t: component_types.count(t) for t in unique_types}
     meets_no_dominance = True
-    if len(components) >= 5:
+    if total >= 5:
         for comp_type, count in type_distribution.items():
-            ratio = count / len(components)
+            ratio = count / total
             if ratio > 0.40:
                 meets_no_dominance = False
                 violations.append(
-                    f"'{comp_type}' dominates at {count}/{len(components)} ({ratio:.0%}), max allowed is 40%"
+                    f"'{comp_type}' dominates at {count}/{total} ({ratio:.0%}), max allowed is 40%"
                 )
 
     return {
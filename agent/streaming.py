@@ -0,0 +1,112 @@
+"""
+Streaming Module - SSE event batching helpers for the AG-UI stream wrapper.
+
+This module holds the framework-independent parts of the streaming path in
+main.py, so they can be used (and tested) without Starlette or Pydantic AI.
+"""
+
+import os
+import asyncio
+
+# SSE batching: the first flush carries SSE_MIN_BATCH_SIZE events, each later
+# flush may carry SSE_BATCH_SIZE_GROWTH_FACTOR times more, up to
+# SSE_MAX_BATCH_SIZE events or SSE_BATCH_WINDOW_MS of waiting
+SSE_MIN_BATCH_SIZE = int(os.getenv("SSE_MIN_BATCH_SIZE", "1"))
+SSE_MAX_BATCH_SIZE = int(os.getenv("SSE_MAX_BATCH_SIZE", "50"))
+SSE_BATCH_SIZE_GROWTH_FACTOR = int(os.getenv("SSE_BATCH_SIZE_GROWTH_FACTOR", "3"))
+SSE_BATCH_WINDOW_MS = float(os.getenv("SSE_BATCH_WINDOW_MS", "15"))
+
+# Marks the end of the upstream event stream in coalesce_sse_events
+_BODY_END = object()
+
+
+# Frame prefixes of state events (the encoder writes the type key first)
+STATE_SNAPSHOT_FRAME_PREFIX = b'data: {"type":"STATE_SNAPSHOT"'
+STATE_DELTA_FRAME_PREFIX = b'data: {"type":"STATE_DELTA"'
+
+
+def drop_superseded_snapshots(frames: list[bytes]) -> list[bytes]:
+    """
+    Drop STATE_SNAPSHOT frames that a later snapshot in the same batch replaces.
+
+    A snapshot is only dropped when no STATE_DELTA sits between it and the
+    next snapshot, so deltas are never applied to a state the client skipped.
+    Only frames holding exactly one event are considered.
+    """
+    kept: list[bytes | None] = []
+    pending_snapshot = None
+    for frame in frames:
+        if frame.find(b"\n\n") == len(frame) - 2:
+            if frame.startswith(STATE_SNAPSHOT_FRAME_PREFIX):
+                if pending_snapshot is not None:
+                    kept[pending_snapshot] = None
+                pending_snapshot = len(kept)
+            elif frame.startswith(STATE_DELTA_FRAME_PREFIX):
+                pending_snapshot = None
+        elif STATE_DELTA_FRAME_PREFIX[6:] in frame:
+            pending_snapshot = None
+        kept.append(frame)
+    return [frame for frame in kept if frame is not None]
+
+
+async def coalesce_sse_events(events):
+    """
+    Merge SSE event frames that arrive close together into a single chunk.
+
+    Each yield through StreamingResponse costs a separate send, so events
+    that are ready within SSE_BATCH_WINDOW_MS of each other are concatenated
+    (complete events end in a blank line, so concatenation stays valid SSE).
+    The batch size starts at SSE_MIN_BATCH_SIZE so the first event is flushed
+    right away, then grows by SSE_BATCH_SIZE_GROWTH_FACTOR per flush up to
+    SSE_MAX_BATCH_SIZE. State snapshots already replaced by a later snapshot
+    in the same batch are not sent (see drop_superseded_snapshots).
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_MAX_BATCH_SIZE)
+
+    async def pump():
+        try:
+            async for event in events:
+                await queue.put((event, None))
+            await queue.put((_BODY_END, None))
+        except Exception as e:
+            await queue.put((_BODY_END, e))
+
+    pump_task = asyncio.create_task(pump())
+    batch_size = SSE_MIN_BATCH_SIZE
+    window = SSE_BATCH_WINDOW_MS / 1000
+    try:
+        finished = False
+        while not finished:
+            event, error = await queue.get()
+            if event is _BODY_END:
+                if error is not None:
+                    raise error
+                break
+
+            batch = [event]
+            deadline = loop.time() + window
+            while len(batch) < batch_size:
+                try:
+                    event, error = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        event, error = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if event is _BODY_END:
+                    finished = True
+                    break
+                batch.append(event)
+
+            if len(batch) > 1:
+                batch = drop_superseded_snapshots(batch)
+            yield b"".join(batch)
+            if error is not None:
+                raise error
+            batch_size = min(batch_size * SSE_BATCH_SIZE_GROWTH_FACTOR, SSE_MAX_BATCH_SIZE)
+    finally:
+        pump_task.cancel()
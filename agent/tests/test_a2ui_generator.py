@@ -84,6 +84,12 @@ from a2ui_generator import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_ids():
+    """Reset ID counter before each test."""
+    reset_id_counter()
+
+
 class TestA2UIComponentModel:
     """Test suite for A2UIComponent Pydantic model."""
 
@@ -150,8 +156,9 @@ class TestA2UIComponentModel:
             )
 
         # Check that validation error occurred for the type field
-        assert "type" in str(exc_info.value)
-        assert "pattern" in str(exc_info.value).lower()
+        msg = str(exc_info.value)
+        assert "type" in msg
+        assert "pattern" in msg.lower()
 
     def test_invalid_component_type_pattern(self):
         """Test that component type must follow PascalCase after 'a2ui.'"""
@@ -212,10 +219,6 @@ class TestA2UIComponentModel:
 class TestGenerateID:
     """Test suite for generate_id() function."""
 
-    def setup_method(self):
-        """Reset ID counter before each test."""
-        reset_id_counter()
-
     def test_generate_id_with_prefix(self):
         """Test ID generation with custom prefix."""
         id1 = generate_id("a2ui.StatCard", prefix="stat")
@@ -226,37 +229,25 @@ class TestGenerateID:
         assert id2 == "stat-2"
         assert id3 == "video-3"
 
-    def test_generate_id_without_prefix(self):
-        """Test ID generation without prefix (extracts from component type)."""
-        id1 = generate_id("a2ui.StatCard")
-        id2 = generate_id("a2ui.VideoCard")
-        id3 = generate_id("a2ui.HeadlineCard")
-
-        assert id1 == "stat-card-1"
-        assert id2 == "video-card-2"
-        assert id3 == "headline-card-3"
-
-    def test_generate_id_pascal_to_kebab(self):
-        """Test PascalCase to kebab-case conversion."""
-        reset_id_counter()
-
-        id1 = generate_id("a2ui.TLDR")
-        id2 = generate_id("a2ui.ExecutiveSummary")
-        id3 = generate_id("a2ui.TableOfContents")
-
-        assert id1 == "t-l-d-r-1"
-        assert id2 == "executive-summary-2"
-        assert id3 == "table-of-contents-3"
+    @pytest.mark.parametrize("component_type,expected_stem", [
+        ("a2ui.StatCard", "stat-card"),
+        ("a2ui.VideoCard", "video-card"),
+        ("a2ui.HeadlineCard", "headline-card"),
+        ("a2ui.TLDR", "t-l-d-r"),
+        ("a2ui.ExecutiveSummary", "executive-summary"),
+        ("a2ui.TableOfContents", "table-of-contents"),
+    ])
+    def test_generate_id_without_prefix(self, component_type, expected_stem):
+        """Test ID generation without prefix (PascalCase type converted to kebab-case)."""
+        assert generate_id(component_type) == f"{expected_stem}-1"
+        assert generate_id(component_type) == f"{expected_stem}-2"
 
     def test_id_uniqueness(self):
         """Test that generated IDs are unique."""
-        ids = set()
-        for i in range(100):
-            new_id = generate_id("a2ui.StatCard", prefix="stat")
-            assert new_id not in ids
-            ids.add(new_id)
+        ids = [generate_id("a2ui.StatCard", prefix="stat") for _ in range(100)]
 
-        assert len(ids) == 100
+        assert ids[-1] == "stat-100"
+        assert len(set(ids)) == 100
 
     def test_reset_id_counter(self):
         """Test that reset_id_counter() resets the counter."""
@@ -275,10 +266,6 @@ class TestGenerateID:
 class TestGenerateComponent:
     """Test suite for generate_component() function."""
 
-    def setup_method(self):
-        """Reset ID counter before each test."""
-        reset_id_counter()
-
     def test_generate_valid_component(self):
         """Test generating a valid component."""
         component = generate_component(
@@ -311,6 +298,33 @@ class TestGenerateComponent:
 
         assert component.children == ["stat-1", "stat-2"]
 
+    def test_generate_component_matches_validated_model(self):
+        """Test that auto-ID components equal ones built through model validation."""
+        props = {"value": "$196B", "label": "Market Size"}
+        component = generate_component("a2ui.StatCard", props=props)
+
+        assert component == A2UIComponent(type="a2ui.StatCard", id="stat-card-1", props=props)
+        assert component.model_dump_json(exclude_none=True) == (
+            '{"type":"a2ui.StatCard","id":"stat-card-1",'
+            '"props":{"value":"$196B","label":"Market Size"}}'
+        )
+
+        assert component.model_fields_set == A2UIComponent(
+            type="a2ui.StatCard", id="stat-card-1", props=props, children=None, layout=None
+        ).model_fields_set
+
+        # Props are copied, as validation would, so later edits don't leak in
+        props["value"] = "changed"
+        assert component.props["value"] == "$196B"
+
+    def test_generate_component_non_str_prop_keys(self):
+        """Test that props with non-str keys are still rejected by validation."""
+        with pytest.raises(ValidationError):
+            generate_component("a2ui.StatCard", props={1: "x"})
+
+        with pytest.raises(ValidationError):
+            generate_components_batch([("a2ui.StatCard", {1: "x"})])
+
     def test_generate_component_invalid_type(self):
         """Test that invalid component type raises ValueError."""
         with pytest.raises(ValueError) as exc_info:
@@ -319,8 +333,9 @@ class TestGenerateComponent:
                 props={"value": "test"}
             )
 
-        assert "Invalid component type" in str(exc_info.value)
-        assert "a2ui.InvalidComponent" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "Invalid component type" in msg
+        assert "a2ui.InvalidComponent" in msg
 
     def test_generate_component_auto_id_generation(self):
         """Test that components get sequential auto-generated IDs."""
@@ -336,10 +351,6 @@ class TestGenerateComponent:
 class TestEmitComponents:
     """Test suite for emit_components() async function."""
 
-    def setup_method(self):
-        """Reset ID counter before each test."""
-        reset_id_counter()
-
     @pytest.mark.asyncio
     async def test_emit_components_ag_ui_format(self):
         """Test emitting components in AG-UI SSE format."""
@@ -348,16 +359,14 @@ class TestEmitComponents:
             generate_component("a2ui.StatCard", props={"value": "50", "label": "Active"}),
         ]
 
-        events = []
-        async for event in emit_components(components, stream_format="ag-ui"):
-            events.append(event)
+        events = [event async for event in emit_components(components, stream_format="ag-ui")]
 
         assert len(events) == 2
-        assert events[0].startswith("data: ")
-        assert events[0].endswith("\n\n")
+        assert events[0].startswith(b"data: ")
+        assert events[0].endswith(b"\n\n")
 
         # Parse the JSON from the event
-        json_str = events[0].replace("data: ", "").strip()
+        json_str = events[0].replace(b"data: ", b"").strip()
         data = json.loads(json_str)
         assert data["type"] == "a2ui.StatCard"
         assert data["id"] == "stat-card-1"
@@ -370,12 +379,10 @@ class TestEmitComponents:
             generate_component("a2ui.VideoCard", props={"videoId": "abc123", "platform": "youtube"}),
         ]
 
-        events = []
-        async for event in emit_components(components, stream_format="json"):
-            events.append(event)
+        events = [event async for event in emit_components(components, stream_format="json")]
 
         assert len(events) == 1
-        assert not event.startswith("data: ")  # No SSE formatting
+        assert not events[0].startswith(b"data: ")  # No SSE formatting
 
         data = json.loads(events[0])
         assert data["type"] == "a2ui.VideoCard"
@@ -397,12 +404,64 @@ class TestEmitComponents:
     @pytest.mark.asyncio
     async def test_emit_empty_components_list(self):
         """Test emitting empty list of components."""
-        events = []
-        async for event in emit_components([]):
-            events.append(event)
+        events = [event async for event in emit_components([])]
 
         assert len(events) == 0
 
+    @pytest.mark.asyncio
+    async def test_emit_components_chunked(self):
+        """Test that chunk_size groups events without changing the stream."""
+        components = [
+            generate_component("a2ui.StatCard", props={"value": str(i), "label": "Test"})
+            for i in range(5)
+        ]
+
+        single = [event async for event in emit_components(components)]
+        chunks = [event async for event in emit_components(components, chunk_size=2)]
+
+        assert len(chunks) == 3
+        assert chunks[0] == single[0] + single[1]
+        assert b"".join(chunks) == b"".join(single)
+
+    @pytest.mark.asyncio
+    async def test_emit_components_invalid_chunk_size(self):
+        """Test that chunk_size below 1 raises ValueError."""
+        with pytest.raises(ValueError) as exc_info:
+            async for event in emit_components([], chunk_size=0):
+                pass
+
+        assert "chunk_size" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_emit_components_matches_model_dump(self):
+        """Test that emitted JSON matches the exclude_none dump, including field order."""
+        component = A2UIComponent(
+            type="a2ui.Section",
+            id="section-1",
+            props={"title": "Overview", "subtitle": None},
+            children=["stat-1"],
+            layout={"width": "full"},
+            zone="hero"
+        )
+
+        events = [event async for event in emit_components([component], stream_format="json")]
+
+        assert json.loads(events[0]) == component.model_dump(exclude_none=True)
+        assert list(json.loads(events[0])) == ["type", "id", "props", "children", "layout", "zone"]
+
+    @pytest.mark.asyncio
+    async def test_emit_components_big_int_props(self):
+        """Test that props orjson can't encode (64-bit overflow) still stream."""
+        component = generate_component(
+            "a2ui.StatCard",
+            props={"value": 2**70, "label": "x"}
+        )
+
+        events = [event async for event in emit_components([component])]
+
+        payload = json.loads(events[0].replace(b"data: ", b""))
+        assert payload == component.model_dump(exclude_none=True)
+
     @pytest.mark.asyncio
     async def test_emit_components_exclude_none(self):
         """Test that None values are excluded from emitted JSON."""
@@ -411,11 +470,9 @@ class TestEmitComponents:
             props={"value": "100", "label": "Test"}
         )
 
-        events = []
-        async for event in emit_components([component]):
-            events.append(event)
+        events = [event async for event in emit_components([component])]
 
-        json_str = events[0].replace("data: ", "").strip()
+        json_str = events[0].replace(b"data: ", b"").strip()
         data = json.loads(json_str)
 
         # children field should not be present (it's None)
@@ -425,34 +482,33 @@ class TestEmitComponents:
 class TestValidateComponentProps:
     """Test suite for validate_component_props() function."""
 
-    def test_validate_stat_card_props(self):
-        """Test validation of StatCard required props."""
-        # Valid props
-        assert validate_component_props(
+    @pytest.mark.parametrize("component_type,valid_props,invalid_props,missing", [
+        (
             "a2ui.StatCard",
-            {"value": "100", "label": "Users", "trend": "up"}
-        ) is True
-
-        # Missing required prop
-        with pytest.raises(ValueError) as exc_info:
-            validate_component_props("a2ui.StatCard", {"value": "100"})
-
-        assert "missing required props" in str(exc_info.value)
-        assert "label" in str(exc_info.value)
-
-    def test_validate_video_card_props(self):
-        """Test validation of VideoCard required props."""
-        # Valid props
-        assert validate_component_props(
+            {"value": "100", "label": "Users", "trend": "up"},
+            {"value": "100"},
+            ["label"],
+        ),
+        (
             "a2ui.VideoCard",
-            {"videoId": "abc123", "platform": "youtube", "title": "Demo"}
-        ) is True
+            {"videoId": "abc123", "platform": "youtube", "title": "Demo"},
+            {"title": "Demo"},
+            ["videoId", "platform"],
+        ),
+    ])
+    def test_validate_required_props(self, component_type, valid_props, invalid_props, missing):
+        """Test validation of required props for components with rules."""
+        # Valid props
+        assert validate_component_props(component_type, valid_props) is True
 
         # Missing required props
         with pytest.raises(ValueError) as exc_info:
-            validate_component_props("a2ui.VideoCard", {"title": "Demo"})
+            validate_component_props(component_type, invalid_props)
 
-        assert "videoId" in str(exc_info.value) or "platform" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "missing required props" in msg
+        for prop in missing:
+            assert prop in msg
 
     def test_validate_unknown_component_type(self):
         """Test validation of component type without required props defined."""
@@ -466,10 +522,6 @@ class TestValidateComponentProps:
 class TestGenerateComponentsBatch:
     """Test suite for generate_components_batch() function."""
 
-    def setup_method(self):
-        """Reset ID counter before each test."""
-        reset_id_counter()
-
     def test_batch_generation(self):
         """Test generating multiple components in batch."""
         specs = [
@@ -536,10 +588,6 @@ class TestComponentTypeRegistry:
 class TestIntegration:
     """Integration tests for complete component generation workflow."""
 
-    def setup_method(self):
-        """Reset ID counter before each test."""
-        reset_id_counter()
-
     @pytest.mark.asyncio
     async def test_full_workflow(self):
         """Test complete workflow from generation to emission."""
@@ -566,15 +614,13 @@ class TestIntegration:
         assert all(isinstance(c, A2UIComponent) for c in components)
 
         # Step 3: Emit components
-        events = []
-        async for event in emit_components(components):
-            events.append(event)
+        events = [event async for event in emit_components(components)]
 
         # Step 4: Verify emission
         assert len(events) == 3
 
         # Parse first event
-        json_str = events[0].replace("data: ", "").strip()
+        json_str = events[0].replace(b"data: ", b"").strip()
         data = json.loads(json_str)
         assert data["type"] == "a2ui.TLDR"
         assert "bulletPoints" in data["props"]
@@ -588,16 +634,13 @@ class TestIntegration:
             components.append(generate_component("a2ui.Section", props={"title": "Test"}))
 
         ids = [c.id for c in components]
+        assert ids[-1] == "section-30"  # Counter is shared across types
         assert len(ids) == len(set(ids))  # All IDs are unique
 
 
 class TestNewsGenerators:
     """Test suite for news component generators."""
 
-    def setup_method(self):
-        """Reset ID counter before each test."""
-        reset_id_counter()
-
     def test_generate_headline_card_basic(self):
         """Test generating HeadlineCard with required fields."""
         card = generate_headline_card(
@@ -790,8 +833,9 @@ class TestNewsGenerators:
                 event_type="invalid_type"
             )
 
-        assert "Invalid event_type" in str(exc_info.value)
-        assert "invalid_type" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "Invalid event_type" in msg
+        assert "invalid_type" in msg
 
     def test_generate_news_ticker_basic(self):
         """Test generating NewsTicker with multiple items."""
@@ -857,8 +901,9 @@ class TestNewsGenerators:
         with pytest.raises(ValueError) as exc_info:
             generate_news_ticker(items)
 
-        assert "supports up to 10 items" in str(exc_info.value)
-        assert "11" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "supports up to 10 items" in msg
+        assert "11" in msg
 
     def test_generate_news_ticker_empty_list(self):
         """Test NewsTicker raises error for empty items list."""
@@ -880,8 +925,9 @@ class TestNewsGenerators:
         with pytest.raises(ValueError) as exc_info:
             generate_news_ticker(items)
 
-        assert "missing required keys" in str(exc_info.value)
-        assert "url" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "missing required keys" in msg
+        assert "url" in msg
 
         # Missing 'timestamp' key
         items = [
@@ -894,17 +940,14 @@ class TestNewsGenerators:
         with pytest.raises(ValueError) as exc_info:
             generate_news_ticker(items)
 
-        assert "missing required keys" in str(exc_info.value)
-        assert "timestamp" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "missing required keys" in msg
+        assert "timestamp" in msg
 
 
 class TestNewsGeneratorsIntegration:
     """Integration tests for news component generators."""
 
-    def setup_method(self):
-        """Reset ID counter before each test."""
-        reset_id_counter()
-
     def test_news_workflow_headline_to_timeline(self):
         """Test creating a news workflow with headline and timeline."""
         # Create headline card
@@ -1006,26 +1049,24 @@ class TestNewsGeneratorsIntegration:
             )
         ]
 
-        events = []
-        async for event in emit_components(components):
-            events.append(event)
+        events = [event async for event in emit_components(components)]
 
         assert len(events) == 3
 
         # Parse and verify first event (HeadlineCard)
-        json_str = events[0].replace("data: ", "").strip()
+        json_str = events[0].replace(b"data: ", b"").strip()
         data = json.loads(json_str)
         assert data["type"] == "a2ui.HeadlineCard"
         assert data["props"]["title"] == "Test Article"
 
         # Parse and verify second event (TrendIndicator)
-        json_str = events[1].replace("data: ", "").strip()
+        json_str = events[1].replace(b"data: ", b"").strip()
         data = json.loads(json_str)
         assert data["type"] == "a2ui.TrendIndicator"
         assert data["props"]["trend"] == "up"
 
         # Parse and verify third event (TimelineEvent)
-        json_str = events[2].replace("data: ", "").strip()
+        json_str = events[2].replace(b"data: ", b"").strip()
         data = json.loads(json_str)
         assert data["type"] == "a2ui.TimelineEvent"
         assert data["props"]["eventType"] == "article"
@@ -1087,10 +1128,6 @@ class TestExtractYoutubeId:
 class TestMediaGenerators:
     """Test suite for media component generators."""
 
-    def setup_method(self):
-        """Reset ID counter before each test."""
-        reset_id_counter()
-
     # VideoCard Tests
 
     def test_generate_video_card_with_video_id(self):
@@ -1226,8 +1263,9 @@ class TestMediaGenerators:
                 image_url="not-a-url"
             )
 
-        assert "must be a valid URL" in str(exc_info.value)
-        assert "http://" in str(exc_info.value) or "https://" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "must be a valid URL" in msg
+        assert "http://" in msg or "https://" in msg
 
     def test_generate_image_card_json_serialization(self):
         """Test ImageCard serializes to valid JSON."""
@@ -1331,8 +1369,9 @@ class TestMediaGenerators:
                 items=items
             )
 
-        assert "supports up to 20 items" in str(exc_info.value)
-        assert "21" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "supports up to 20 items" in msg
+        assert "21" in msg
 
     def test_generate_playlist_card_empty_items(self):
         """Test PlaylistCard raises error for empty items list."""
@@ -1387,9 +1426,10 @@ class TestMediaGenerators:
                 platform="invalid"
             )
 
-        assert "Invalid platform" in str(exc_info.value)
-        assert "youtube" in str(exc_info.value)
-        assert "spotify" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "Invalid platform" in msg
+        assert "youtube" in msg
+        assert "spotify" in msg
 
     # PodcastCard Tests
 
@@ -1492,9 +1532,10 @@ class TestMediaGenerators:
                 platform="invalid"
             )
 
-        assert "Invalid platform" in str(exc_info.value)
-        assert "spotify" in str(exc_info.value)
-        assert "apple" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "Invalid platform" in msg
+        assert "spotify" in msg
+        assert "apple" in msg
 
     def test_generate_podcast_card_json_serialization(self):
         """Test PodcastCard serializes to valid JSON."""
@@ -1518,10 +1559,6 @@ class TestMediaGenerators:
 class TestMediaGeneratorsIntegration:
     """Integration tests for media component generators."""
 
-    def setup_method(self):
-        """Reset ID counter before each test."""
-        reset_id_counter()
-
     def test_media_workflow_complete(self):
         """Test complete media workflow with all media types."""
         # Create video card
@@ -1610,26 +1647,24 @@ class TestMediaGeneratorsIntegration:
             )
         ]
 
-        events = []
-        async for event in emit_components(components):
-            events.append(event)
+        events = [event async for event in emit_components(components)]
 
         assert len(events) == 3
 
         # Parse and verify VideoCard
-        json_str = events[0].replace("data: ", "").strip()
+        json_str = events[0].replace(b"data: ", b"").strip()
         data = json.loads(json_str)
         assert data["type"] == "a2ui.VideoCard"
         assert data["props"]["videoId"] == "abc123"
 
         # Parse and verify ImageCard
-        json_str = events[1].replace("data: ", "").strip()
+        json_str = events[1].replace(b"data: ", b"").strip()
         data = json.loads(json_str)
         assert data["type"] == "a2ui.ImageCard"
         assert data["props"]["imageUrl"] == "https://example.com/image.jpg"
 
         # Parse and verify PodcastCard
-        json_str = events[2].replace("data: ", "").strip()
+        json_str = events[2].replace(b"data: ", b"").strip()
         data = json.loads(json_str)
         assert data["type"] == "a2ui.PodcastCard"
         assert data["props"]["duration"] == 30
@@ -1695,10 +1730,6 @@ class TestMediaGeneratorsIntegration:
 class TestDataGenerators:
     """Test suite for data component generators."""
 
-    def setup_method(self):
-        """Reset ID counter before each test."""
-        reset_id_counter()
-
     # StatCard Tests
 
     def test_generate_stat_card_basic(self):
@@ -1759,8 +1790,9 @@ class TestDataGenerators:
                 title="Test", value="100", change_type="invalid"
             )
 
-        assert "Invalid change_type" in str(exc_info.value)
-        assert "invalid" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "Invalid change_type" in msg
+        assert "invalid" in msg
 
     def test_generate_stat_card_negative_change_positive_type(self):
         """Test StatCard can have negative change with positive type (e.g., lower error rate)."""
@@ -1837,8 +1869,9 @@ class TestDataGenerators:
                 label="Test", value="100", status="invalid"
             )
 
-        assert "Invalid status" in str(exc_info.value)
-        assert "invalid" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "Invalid status" in msg
+        assert "invalid" in msg
 
     def test_generate_metric_row_json_serialization(self):
         """Test MetricRow serializes to valid JSON."""
@@ -1903,8 +1936,9 @@ class TestDataGenerators:
                 label="Test", current=50, color="pink"
             )
 
-        assert "Invalid color" in str(exc_info.value)
-        assert "pink" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "Invalid color" in msg
+        assert "pink" in msg
 
     def test_generate_progress_ring_edge_cases(self):
         """Test ProgressRing with edge case values (0%, 100%, >100%)."""
@@ -2050,8 +2084,9 @@ class TestDataGenerators:
                 items=items
             )
 
-        assert "supports up to 10 items" in str(exc_info.value)
-        assert "11" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "supports up to 10 items" in msg
+        assert "11" in msg
 
     def test_generate_comparison_bar_empty_items(self):
         """Test ComparisonBar raises error for empty items list."""
@@ -2165,8 +2200,9 @@ class TestDataGenerators:
                 rows=rows
             )
 
-        assert "supports up to 50 rows" in str(exc_info.value)
-        assert "51" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "supports up to 50 rows" in msg
+        assert "51" in msg
 
     def test_generate_data_table_empty_headers(self):
         """Test DataTable raises error for empty headers."""
@@ -2267,8 +2303,9 @@ class TestDataGenerators:
                 data_points=[10, 20, 30, 40, 50]
             )
 
-        assert "Invalid chart_type" in str(exc_info.value)
-        assert "scatter" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "Invalid chart_type" in msg
+        assert "scatter" in msg
 
     def test_generate_mini_chart_minimum_data_points(self):
         """Test MiniChart with minimum 5 data points."""
@@ -2287,8 +2324,9 @@ class TestDataGenerators:
                 data_points=[10, 20, 30, 40]
             )
 
-        assert "requires at least 5 data points" in str(exc_info.value)
-        assert "4" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "requires at least 5 data points" in msg
+        assert "4" in msg
 
     def test_generate_mini_chart_maximum_data_points(self):
         """Test MiniChart with maximum 100 data points."""
@@ -2311,8 +2349,9 @@ class TestDataGenerators:
                 data_points=data_points
             )
 
-        assert "supports up to 100 data points" in str(exc_info.value)
-        assert "101" in str(exc_info.value)
+        msg = str(exc_info.value)
+        assert "supports up to 100 data points" in msg
+        assert "101" in msg
 
     def test_generate_mini_chart_labels_mismatch(self):
         """Test MiniChart raises error when labels length doesn't match data points."""
@@ -2349,10 +2388,6 @@ class TestDataGenerators:
 class TestDataGeneratorsIntegration:
     """Integration tests for data component generators."""
 
-    def setup_method(self):
-        """Reset ID counter before each test."""
-        reset_id_counter()
-
     def test_data_integration_complete_dashboard(self):
         """Test creating a complete data dashboard with all data components."""
         components = []
@@ -2565,9 +2600,7 @@ class TestDataGeneratorsIntegration:
             )
         ]
 
-        events = []
-        async for event in emit_components(components):
-            events.append(event)
+        events = [event async for event in emit_components(components)]
 
         assert len(events) == 6
 
@@ -2580,7 +2613,7 @@ class TestDataGeneratorsIntegration:
             "a2ui.DataTable",
             "a2ui.MiniChart"
         ]):
-            json_str = events[i].replace("data: ", "").strip()
+            json_str = events[i].replace(b"data: ", b"").strip()
             data = json.loads(json_str)
             assert data["type"] == expected_type
 
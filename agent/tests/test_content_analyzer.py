@@ -0,0 +1,85 @@
+"""
+Tests for Content Analyzer Module.
+
+Test suite for content_analyzer.py covering:
+- ContentAnalysis structural count properties
+- parse_markdown result caching and copy isolation
+- YouTube/GitHub link bucketing
+"""
+
+from collections import OrderedDict
+
+import content_analyzer
+from content_analyzer import ContentAnalysis, parse_markdown
+
+
+class TestContentAnalysisCounts:
+    """Test the structural count properties on ContentAnalysis."""
+
+    def test_counts_track_field_updates(self):
+        """Test that counts reflect copies and later mutation of the fields."""
+        analysis = ContentAnalysis(
+            title="Doc",
+            document_type="tutorial",
+            code_blocks=[{"language": "python", "code": "pass"}]
+        )
+        assert analysis.code_count == 1
+
+        copied = analysis.model_copy(update={"code_blocks": []})
+        assert copied.code_count == 0
+
+        analysis.code_blocks.append({"language": "bash", "code": "ls"})
+        assert analysis.code_count == 2
+
+
+class TestParseMarkdown:
+    """Test parse_markdown caching and link bucketing."""
+
+    def test_mutating_result_does_not_affect_next_call(self):
+        """Test that each call gets its own copy of the cached result."""
+        markdown = "# Title\n\n## Intro\n\nSee https://github.com/octo/cat"
+
+        first = parse_markdown(markdown)
+        first['sections'].append('Injected')
+        first['github_links'].clear()
+        first['title'] = 'Changed'
+
+        second = parse_markdown(markdown)
+
+        assert second['title'] == 'Title'
+        assert 'Injected' not in second['sections']
+        assert second['github_links'] == ['https://github.com/octo/cat']
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """Test that the cache holds at most PARSE_CACHE_MAX_SIZE documents."""
+        monkeypatch.setattr(content_analyzer, 'PARSE_CACHE_MAX_SIZE', 2)
+        monkeypatch.setattr(content_analyzer, '_parse_cache', OrderedDict())
+        parsed = []
+        uncached = content_analyzer._parse_markdown_uncached
+        monkeypatch.setattr(
+            content_analyzer,
+            '_parse_markdown_uncached',
+            lambda content: parsed.append(content) or uncached(content)
+        )
+
+        parse_markdown("# A")
+        parse_markdown("# B")
+        parse_markdown("# A")  # hit; B is now least recently used
+        parse_markdown("# C")  # evicts B
+
+        assert len(content_analyzer._parse_cache) == 2
+        assert parsed == ["# A", "# B", "# C"]
+
+        parse_markdown("# A")
+        parse_markdown("# B")
+        assert parsed == ["# A", "# B", "# C", "# B"]
+
+    def test_github_url_inside_youtube_query_is_youtube_only(self):
+        """Test that a GitHub URL in a YouTube query string isn't reported as GitHub."""
+        youtube = "https://www.youtube.com/watch?v=dQw4w9WgXcQ&ref=https://github.com/user/repo"
+        markdown = f"Watch {youtube} and see https://github.com/octo/cat"
+
+        result = parse_markdown(markdown)
+
+        assert result['youtube_links'] == [youtube]
+        assert result['github_links'] == ['https://github.com/octo/cat']
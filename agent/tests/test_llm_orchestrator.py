@@ -0,0 +1,122 @@
+"""
+Tests for LLM Orchestrator Module.
+
+Test suite for llm_orchestrator.py covering:
+- Single-flight coalescing of identical in-flight LLM calls
+"""
+
+import asyncio
+
+import pytest
+import llm_orchestrator
+from llm_orchestrator import call_llm
+
+
+class TestCallLlmSingleFlight:
+    """Test suite for in-flight request sharing in call_llm()."""
+
+    @pytest.fixture(autouse=True)
+    def fake_post(self, monkeypatch):
+        """Replace the HTTP call with a fake that records bodies and waits on a gate."""
+        self.posted = []
+        self.cancelled_posts = 0
+        self.release = asyncio.Event()
+        self.error = None
+
+        async def post_chat_completion(body: bytes) -> str:
+            self.posted.append(body)
+            try:
+                await self.release.wait()
+            except asyncio.CancelledError:
+                self.cancelled_posts += 1
+                raise
+            if self.error is not None:
+                raise self.error
+            return f"response-{len(self.posted)}"
+
+        monkeypatch.setattr(llm_orchestrator, "OPENROUTER_API_KEY", "test-key")
+        monkeypatch.setattr(llm_orchestrator, "_INFLIGHT_REQUESTS", {})
+        monkeypatch.setattr(llm_orchestrator, "_post_chat_completion", post_chat_completion)
+
+    async def _settle(self):
+        """Let scheduled tasks and done callbacks run."""
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_calls_share_one_post(self):
+        """Test that identical concurrent calls make one POST and get the same result."""
+        calls = asyncio.gather(call_llm("Summarize"), call_llm("Summarize"))
+        await self._settle()
+        self.release.set()
+
+        first, second = await calls
+
+        assert len(self.posted) == 1
+        assert first == second == "response-1"
+
+    @pytest.mark.asyncio
+    async def test_different_bodies_make_separate_posts(self):
+        """Test that calls with different bodies are not shared."""
+        calls = asyncio.gather(call_llm("Summarize"), call_llm("Summarize", temperature=0.2))
+        await self._settle()
+        self.release.set()
+
+        await calls
+
+        assert len(self.posted) == 2
+        assert self.posted[0] != self.posted[1]
+
+    @pytest.mark.asyncio
+    async def test_entry_removed_after_success(self):
+        """Test that a finished request leaves the in-flight table."""
+        self.release.set()
+
+        await call_llm("Summarize")
+        await self._settle()
+
+        assert llm_orchestrator._INFLIGHT_REQUESTS == {}
+
+    @pytest.mark.asyncio
+    async def test_entry_removed_after_failure(self):
+        """Test that a failed request leaves the in-flight table and later calls retry."""
+        self.error = RuntimeError("LLM API error: 500")
+        self.release.set()
+
+        with pytest.raises(RuntimeError, match="LLM API error"):
+            await call_llm("Summarize")
+        await self._settle()
+
+        assert llm_orchestrator._INFLIGHT_REQUESTS == {}
+
+        self.error = None
+        assert await call_llm("Summarize") == "response-2"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_request(self):
+        """Test that cancelling one caller leaves the shared request running for the other."""
+        cancelled = asyncio.ensure_future(call_llm("Summarize"))
+        waiting = asyncio.ensure_future(call_llm("Summarize"))
+        await self._settle()
+
+        cancelled.cancel()
+        await self._settle()
+        self.release.set()
+
+        assert await waiting == "response-1"
+        assert cancelled.cancelled()
+        assert len(self.posted) == 1
+        assert self.cancelled_posts == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelling_only_waiter_cancels_request(self):
+        """Test that the POST is cancelled once no caller is waiting for it."""
+        only = asyncio.ensure_future(call_llm("Summarize"))
+        await self._settle()
+
+        only.cancel()
+        await self._settle()
+
+        assert only.cancelled()
+        assert self.cancelled_posts == 1
+        assert llm_orchestrator._INFLIGHT_REQUESTS == {}
@@ -414,6 +414,44 @@ class TestComponentVarietyValidation:
         assert distribution['LinkCard'] == 1
         assert distribution['TLDR'] == 1
 
+    def test_fail_fast_stops_at_first_decisive_violation(self):
+        """Test fail_fast reports invalid without scanning the remaining components."""
+        components = [
+            {'component_type': 'TLDR'},
+            {'component_type': 'CodeBlock'},
+            {'component_type': 'LinkCard'},
+            {'component_type': 'StatCard'},
+            {'component_type': 'StatCard'},
+            {'component_type': 'StatCard'},
+            {'component_type': 'StatCard'},
+            {'component_type': 'QuoteCard'},
+        ]
+
+        result = validate_component_variety(components, fail_fast=True)
+
+        assert result['valid'] is False
+        assert result['meets_no_consecutive'] is False
+        assert result['max_consecutive_same_type'] == 3
+        assert 'QuoteCard' not in result['component_type_distribution']
+        assert validate_component_variety(components)['max_consecutive_same_type'] == 4
+
+    def test_repeated_validation_is_not_affected_by_mutation(self):
+        """Test that mutating a result doesn't leak into later identical calls."""
+        components = [
+            {'component_type': 'StatCard'},
+            {'component_type': 'StatCard'},
+            {'component_type': 'CodeBlock'},
+        ]
+
+        first = validate_component_variety(components)
+        first['violations'].append('extra')
+        first['component_type_distribution']['StatCard'] = 99
+
+        second = validate_component_variety(components)
+
+        assert second['violations'] == ['Only 2 unique types, need at least 4']
+        assert second['component_type_distribution'] == {'StatCard': 2, 'CodeBlock': 1}
+
     def test_long_consecutive_sequence(self):
         """Test validation catches long consecutive sequences."""
         components = [
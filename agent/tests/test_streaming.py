@@ -0,0 +1,125 @@
+"""
+Tests for Streaming Module.
+
+Test suite for the framework-independent SSE helpers covering:
+- Dropping superseded state snapshots
+- Coalescing SSE events into growing batches
+"""
+
+import asyncio
+
+import pytest
+import streaming
+from streaming import (
+    coalesce_sse_events,
+    drop_superseded_snapshots,
+)
+
+SNAPSHOT_1 = b'data: {"type":"STATE_SNAPSHOT","snapshot":{"step":1}}\n\n'
+SNAPSHOT_2 = b'data: {"type":"STATE_SNAPSHOT","snapshot":{"step":2}}\n\n'
+DELTA = b'data: {"type":"STATE_DELTA","delta":[]}\n\n'
+TEXT = b'data: {"type":"TEXT_MESSAGE_CONTENT","delta":"hi"}\n\n'
+
+
+class TestDropSupersededSnapshots:
+    """Test suite for drop_superseded_snapshots()."""
+
+    def test_snapshot_replaced_by_later_snapshot_is_dropped(self):
+        """Test S, T, S keeps only the other event and the last snapshot."""
+        assert drop_superseded_snapshots([SNAPSHOT_1, TEXT, SNAPSHOT_2]) == [TEXT, SNAPSHOT_2]
+
+    def test_snapshot_followed_by_delta_is_kept(self):
+        """Test S, D, S is kept in full so the delta applies to a state the client saw."""
+        frames = [SNAPSHOT_1, DELTA, SNAPSHOT_2]
+
+        assert drop_superseded_snapshots(frames) == frames
+
+    def test_multi_event_frame_with_delta_resets_pending_snapshot(self):
+        """Test a multi-event frame containing a STATE_DELTA keeps the earlier snapshot."""
+        frames = [SNAPSHOT_1, TEXT + DELTA, SNAPSHOT_2]
+
+        assert drop_superseded_snapshots(frames) == frames
+
+    def test_multi_event_frame_without_delta_does_not_reset(self):
+        """Test a multi-event frame without a STATE_DELTA doesn't protect the snapshot."""
+        frames = [SNAPSHOT_1, TEXT + TEXT, SNAPSHOT_2]
+
+        assert drop_superseded_snapshots(frames) == [TEXT + TEXT, SNAPSHOT_2]
+
+
+def text_event(index: int) -> bytes:
+    """Build a distinct single-event SSE frame."""
+    return f'data: {{"type":"TEXT_MESSAGE_CONTENT","delta":"{index}"}}\n\n'.encode()
+
+
+async def ready_events(events):
+    """Yield already-available events without waiting between them."""
+    for event in events:
+        yield event
+
+
+class TestCoalesceSseEvents:
+    """Test suite for coalesce_sse_events()."""
+
+    @pytest.fixture(autouse=True)
+    def batch_settings(self, monkeypatch):
+        """Pin the batching settings regardless of the environment."""
+        monkeypatch.setattr(streaming, "SSE_MIN_BATCH_SIZE", 1)
+        monkeypatch.setattr(streaming, "SSE_MAX_BATCH_SIZE", 50)
+        monkeypatch.setattr(streaming, "SSE_BATCH_SIZE_GROWTH_FACTOR", 3)
+        monkeypatch.setattr(streaming, "SSE_BATCH_WINDOW_MS", 15)
+
+    @pytest.mark.asyncio
+    async def test_batches_grow_geometrically(self):
+        """Test that ready events are flushed in batches of 1, 3, 9, 27, ..."""
+        events = [text_event(i) for i in range(100)]
+
+        chunks = [chunk async for chunk in coalesce_sse_events(ready_events(events))]
+
+        assert [chunk.count(b"\n\n") for chunk in chunks] == [1, 3, 9, 27, 50, 10]
+
+    @pytest.mark.asyncio
+    async def test_stream_bytes_are_unchanged(self):
+        """Test that the coalesced stream is byte-for-byte the input stream."""
+        events = [text_event(i) for i in range(40)]
+
+        chunks = [chunk async for chunk in coalesce_sse_events(ready_events(events))]
+
+        assert b"".join(chunks) == b"".join(events)
+
+    @pytest.mark.asyncio
+    async def test_upstream_error_raised_after_pending_batch(self):
+        """Test that events before an upstream failure are flushed before it is raised."""
+        async def failing_events():
+            for i in range(3):
+                yield text_event(i)
+            raise RuntimeError("upstream failed")
+
+        received = []
+        with pytest.raises(RuntimeError, match="upstream failed"):
+            async for chunk in coalesce_sse_events(failing_events()):
+                received.append(chunk)
+
+        assert b"".join(received) == b"".join(text_event(i) for i in range(3))
+
+    @pytest.mark.asyncio
+    async def test_early_close_cancels_pump_task(self):
+        """Test that closing the stream early cancels the producer task."""
+        async def endless_events():
+            i = 0
+            while True:
+                yield text_event(i)
+                i += 1
+                await asyncio.sleep(0)
+
+        tasks_before = asyncio.all_tasks()
+        stream = coalesce_sse_events(endless_events())
+        await stream.__anext__()
+        pump_tasks = asyncio.all_tasks() - tasks_before
+        assert len(pump_tasks) == 1
+
+        await stream.aclose()
+        pump_task = pump_tasks.pop()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(pump_task, 1)
+        assert pump_task.cancelled()
@@ -10,6 +10,8 @@ Comprehensive test suite for tag and badge component generators covering:
 - Parameter validation and edge cases
 """
 
+import re
+
 import pytest
 from a2ui_generator import (
     reset_id_counter,
@@ -20,39 +22,87 @@ from a2ui_generator import (
     generate_priority_badge,
 )
 
+# Error-message patterns, compiled once and shared by the negative tests
+_ERR_TAG_EMPTY = re.compile(r"Tag label cannot be empty")
+_ERR_TAG_TYPE = re.compile(r"Tag type must be one of")
+_ERR_BADGE_EMPTY = re.compile(r"Badge label cannot be empty")
+_ERR_BADGE_COUNT = re.compile(r"Badge count must be non-negative")
+_ERR_BADGE_STYLE = re.compile(r"Badge style must be one of")
+_ERR_BADGE_SIZE = re.compile(r"Badge size must be one of")
+_ERR_CATEGORY_EMPTY = re.compile(r"CategoryTag name cannot be empty")
+_ERR_HEX_COLOR = re.compile(r"Invalid hex color format")
+_ERR_STATUS = re.compile(r"StatusIndicator status must be one of")
+_ERR_STATUS_EMPTY = re.compile(r"StatusIndicator label cannot be empty")
+_ERR_PRIORITY_LEVEL = re.compile(r"PriorityBadge level must be one of")
+_ERR_PRIORITY_EMPTY = re.compile(r"PriorityBadge label cannot be empty")
+
+
+@pytest.fixture(autouse=True)
+def reset_ids():
+    """Reset ID counter before each test."""
+    reset_id_counter()
+
 
 class TestTagGenerators:
     """Test suite for tag and badge component generators."""
 
     # ========================================================================
-    # Tag Generator Tests
+    # Basic Generation Tests
     # ========================================================================
 
-    def test_generate_tag_basic(self):
-        """Test basic tag generation with default type."""
-        reset_id_counter()
-
-        tag = generate_tag(label="JavaScript")
+    @pytest.mark.parametrize("factory,kwargs,expected_type,expected_props", [
+        (
+            generate_tag,
+            {"label": "JavaScript"},
+            "a2ui.Tag",
+            {"label": "JavaScript", "type": "default"},
+        ),
+        (
+            generate_badge,
+            {"label": "Notifications", "count": 5},
+            "a2ui.Badge",
+            {"label": "Notifications", "count": 5, "style": "default", "size": "medium"},
+        ),
+        (
+            generate_category_tag,
+            {"name": "Technology"},
+            "a2ui.CategoryTag",
+            {"name": "Technology"},
+        ),
+        (
+            generate_status_indicator,
+            {"status": "success"},
+            "a2ui.StatusIndicator",
+            {"status": "success"},
+        ),
+        (
+            generate_priority_badge,
+            {"level": "medium"},
+            "a2ui.PriorityBadge",
+            {"level": "medium"},
+        ),
+    ])
+    def test_generate_basic(self, factory, kwargs, expected_type, expected_props):
+        """Test basic generation with defaults; optional props are omitted."""
+        component = factory(**kwargs)
+
+        assert component.type == expected_type
+        assert component.props == expected_props
 
-        assert tag.type == "a2ui.Tag"
-        assert tag.props["label"] == "JavaScript"
-        assert tag.props["type"] == "default"
-        assert "icon" not in tag.props
-        assert "removable" not in tag.props
-
-    def test_generate_tag_with_type_variants(self):
-        """Test tag generation with all valid type variants."""
-        reset_id_counter()
+    # ========================================================================
+    # Tag Generator Tests
+    # ========================================================================
 
-        valid_types = ["default", "primary", "success", "warning", "error", "info"]
-        for tag_type in valid_types:
-            tag = generate_tag(label="Test", type=tag_type)
-            assert tag.props["type"] == tag_type
+    @pytest.mark.parametrize(
+        "tag_type", ["default", "primary", "success", "warning", "error", "info"]
+    )
+    def test_generate_tag_with_type_variants(self, tag_type):
+        """Test tag generation with each valid type variant."""
+        tag = generate_tag(label="Test", type=tag_type)
+        assert tag.props["type"] == tag_type
 
     def test_generate_tag_with_icon(self):
         """Test tag with icon."""
-        reset_id_counter()
-
         tag = generate_tag(
             label="Featured",
             type="primary",
@@ -65,8 +115,6 @@ class TestTagGenerators:
 
     def test_generate_tag_removable(self):
         """Test removable tag."""
-        reset_id_counter()
-
         tag = generate_tag(
             label="Filter: Python",
             type="info",
@@ -78,29 +126,23 @@ class TestTagGenerators:
 
     def test_generate_tag_non_removable_by_default(self):
         """Test that tags are not removable by default."""
-        reset_id_counter()
-
         tag = generate_tag(label="Test")
 
         assert "removable" not in tag.props
 
-    def test_generate_tag_empty_label(self):
+    @pytest.mark.parametrize("bad", ["", "   "])
+    def test_generate_tag_empty_label(self, bad):
         """Test tag with empty label raises error."""
-        with pytest.raises(ValueError, match="Tag label cannot be empty"):
-            generate_tag(label="")
-
-        with pytest.raises(ValueError, match="Tag label cannot be empty"):
-            generate_tag(label="   ")
+        with pytest.raises(ValueError, match=_ERR_TAG_EMPTY):
+            generate_tag(label=bad)
 
     def test_generate_tag_invalid_type(self):
         """Test tag with invalid type raises error."""
-        with pytest.raises(ValueError, match="Tag type must be one of"):
+        with pytest.raises(ValueError, match=_ERR_TAG_TYPE):
             generate_tag(label="Test", type="invalid")
 
     def test_generate_tag_label_whitespace_trimmed(self):
         """Test that tag label whitespace is trimmed."""
-        reset_id_counter()
-
         tag = generate_tag(label="  Python  ")
 
         assert tag.props["label"] == "Python"
@@ -109,79 +151,55 @@ class TestTagGenerators:
     # Badge Generator Tests
     # ========================================================================
 
-    def test_generate_badge_basic(self):
-        """Test basic badge generation."""
-        reset_id_counter()
-
-        badge = generate_badge(label="Notifications", count=5)
+    @pytest.mark.parametrize(
+        "style", ["default", "primary", "success", "warning", "error"]
+    )
+    def test_generate_badge_with_style_variants(self, style):
+        """Test badge generation with each valid style variant."""
+        badge = generate_badge(label="Test", count=1, style=style)
+        assert badge.props["style"] == style
 
-        assert badge.type == "a2ui.Badge"
-        assert badge.props["label"] == "Notifications"
-        assert badge.props["count"] == 5
-        assert badge.props["style"] == "default"
-        assert badge.props["size"] == "medium"
-
-    def test_generate_badge_with_style_variants(self):
-        """Test badge generation with all valid style variants."""
-        reset_id_counter()
-
-        valid_styles = ["default", "primary", "success", "warning", "error"]
-        for style in valid_styles:
-            badge = generate_badge(label="Test", count=1, style=style)
-            assert badge.props["style"] == style
-
-    def test_generate_badge_with_size_variants(self):
-        """Test badge generation with all valid size variants."""
-        reset_id_counter()
-
-        valid_sizes = ["small", "medium", "large"]
-        for size in valid_sizes:
-            badge = generate_badge(label="Test", count=1, size=size)
-            assert badge.props["size"] == size
+    @pytest.mark.parametrize("size", ["small", "medium", "large"])
+    def test_generate_badge_with_size_variants(self, size):
+        """Test badge generation with each valid size variant."""
+        badge = generate_badge(label="Test", count=1, size=size)
+        assert badge.props["size"] == size
 
     def test_generate_badge_zero_count(self):
         """Test badge with zero count."""
-        reset_id_counter()
-
         badge = generate_badge(label="Done", count=0)
 
         assert badge.props["count"] == 0
 
     def test_generate_badge_large_count(self):
         """Test badge with large count."""
-        reset_id_counter()
-
         badge = generate_badge(label="Stars", count=99999)
 
         assert badge.props["count"] == 99999
 
     def test_generate_badge_negative_count(self):
         """Test badge with negative count raises error."""
-        with pytest.raises(ValueError, match="Badge count must be non-negative"):
+        with pytest.raises(ValueError, match=_ERR_BADGE_COUNT):
             generate_badge(label="Test", count=-1)
 
-    def test_generate_badge_empty_label(self):
+    @pytest.mark.parametrize("bad", ["", "   "])
+    def test_generate_badge_empty_label(self, bad):
         """Test badge with empty label raises error."""
-        with pytest.raises(ValueError, match="Badge label cannot be empty"):
-            generate_badge(label="", count=5)
-
-        with pytest.raises(ValueError, match="Badge label cannot be empty"):
-            generate_badge(label="   ", count=5)
+        with pytest.raises(ValueError, match=_ERR_BADGE_EMPTY):
+            generate_badge(label=bad, count=5)
 
     def test_generate_badge_invalid_style(self):
         """Test badge with invalid style raises error."""
-        with pytest.raises(ValueError, match="Badge style must be one of"):
+        with pytest.raises(ValueError, match=_ERR_BADGE_STYLE):
             generate_badge(label="Test", count=5, style="invalid")
 
     def test_generate_badge_invalid_size(self):
         """Test badge with invalid size raises error."""
-        with pytest.raises(ValueError, match="Badge size must be one of"):
+        with pytest.raises(ValueError, match=_ERR_BADGE_SIZE):
             generate_badge(label="Test", count=5, size="extra-large")
 
     def test_generate_badge_label_whitespace_trimmed(self):
         """Test that badge label whitespace is trimmed."""
-        reset_id_counter()
-
         badge = generate_badge(label="  Unread  ", count=10)
 
         assert badge.props["label"] == "Unread"
@@ -190,21 +208,8 @@ class TestTagGenerators:
     # CategoryTag Generator Tests
     # ========================================================================
 
-    def test_generate_category_tag_basic(self):
-        """Test basic category tag generation."""
-        reset_id_counter()
-
-        tag = generate_category_tag(name="Technology")
-
-        assert tag.type == "a2ui.CategoryTag"
-        assert tag.props["name"] == "Technology"
-        assert "color" not in tag.props
-        assert "icon" not in tag.props
-
     def test_generate_category_tag_with_semantic_color(self):
         """Test category tag with semantic color name."""
-        reset_id_counter()
-
         tag = generate_category_tag(name="AI & ML", color="blue")
 
         assert tag.props["color"] == "blue"
@@ -212,24 +217,18 @@ class TestTagGenerators:
 
     def test_generate_category_tag_with_hex_color(self):
         """Test category tag with hex color code."""
-        reset_id_counter()
-
         tag = generate_category_tag(name="Science", color="#3B82F6")
 
         assert tag.props["color"] == "#3B82F6"
 
     def test_generate_category_tag_with_short_hex_color(self):
         """Test category tag with 3-digit hex color."""
-        reset_id_counter()
-
         tag = generate_category_tag(name="Design", color="#F00")
 
         assert tag.props["color"] == "#F00"
 
     def test_generate_category_tag_with_icon(self):
         """Test category tag with icon."""
-        reset_id_counter()
-
         tag = generate_category_tag(
             name="Education",
             icon="book"
@@ -240,8 +239,6 @@ class TestTagGenerators:
 
     def test_generate_category_tag_with_color_and_icon(self):
         """Test category tag with both color and icon."""
-        reset_id_counter()
-
         tag = generate_category_tag(
             name="Science",
             color="purple",
@@ -251,29 +248,25 @@ class TestTagGenerators:
         assert tag.props["color"] == "purple"
         assert tag.props["icon"] == "flask"
 
-    def test_generate_category_tag_empty_name(self):
+    @pytest.mark.parametrize("bad", ["", "   "])
+    def test_generate_category_tag_empty_name(self, bad):
         """Test category tag with empty name raises error."""
-        with pytest.raises(ValueError, match="CategoryTag name cannot be empty"):
-            generate_category_tag(name="")
-
-        with pytest.raises(ValueError, match="CategoryTag name cannot be empty"):
-            generate_category_tag(name="   ")
+        with pytest.raises(ValueError, match=_ERR_CATEGORY_EMPTY):
+            generate_category_tag(name=bad)
 
     def test_generate_category_tag_invalid_hex_color(self):
         """Test category tag with invalid hex color raises error."""
-        with pytest.raises(ValueError, match="Invalid hex color format"):
+        with pytest.raises(ValueError, match=_ERR_HEX_COLOR):
             generate_category_tag(name="Test", color="#GGG")
 
-        with pytest.raises(ValueError, match="Invalid hex color format"):
+        with pytest.raises(ValueError, match=_ERR_HEX_COLOR):
             generate_category_tag(name="Test", color="#12345")
 
-        with pytest.raises(ValueError, match="Invalid hex color format"):
+        with pytest.raises(ValueError, match=_ERR_HEX_COLOR):
             generate_category_tag(name="Test", color="#1234567")
 
     def test_generate_category_tag_name_whitespace_trimmed(self):
         """Test that category tag name whitespace is trimmed."""
-        reset_id_counter()
-
         tag = generate_category_tag(name="  Business  ")
 
         assert tag.props["name"] == "Business"
@@ -282,90 +275,39 @@ class TestTagGenerators:
     # StatusIndicator Generator Tests
     # ========================================================================
 
-    def test_generate_status_indicator_basic(self):
-        """Test basic status indicator generation."""
-        reset_id_counter()
-
-        indicator = generate_status_indicator(status="success")
-
-        assert indicator.type == "a2ui.StatusIndicator"
-        assert indicator.props["status"] == "success"
-        assert "label" not in indicator.props
-
-    def test_generate_status_indicator_all_statuses(self):
-        """Test status indicator with all valid status types."""
-        reset_id_counter()
-
-        valid_statuses = ["success", "warning", "error", "info", "loading"]
-        for status in valid_statuses:
-            indicator = generate_status_indicator(status=status)
-            assert indicator.props["status"] == status
-
-    def test_generate_status_indicator_with_custom_label(self):
+    @pytest.mark.parametrize(
+        "status", ["success", "warning", "error", "info", "loading"]
+    )
+    def test_generate_status_indicator_all_statuses(self, status):
+        """Test status indicator with each valid status type."""
+        indicator = generate_status_indicator(status=status)
+        assert indicator.props["status"] == status
+
+    @pytest.mark.parametrize("status,label", [
+        ("success", "Deployment Complete"),
+        ("warning", "Maintenance Mode"),
+        ("error", "Connection Failed"),
+        ("loading", "Fetching data..."),
+    ])
+    def test_generate_status_indicator_with_custom_label(self, status, label):
         """Test status indicator with custom label."""
-        reset_id_counter()
-
-        indicator = generate_status_indicator(
-            status="success",
-            label="Deployment Complete"
-        )
+        indicator = generate_status_indicator(status=status, label=label)
 
-        assert indicator.props["label"] == "Deployment Complete"
-        assert indicator.props["status"] == "success"
-
-    def test_generate_status_indicator_warning_with_label(self):
-        """Test warning status with custom label."""
-        reset_id_counter()
-
-        indicator = generate_status_indicator(
-            status="warning",
-            label="Maintenance Mode"
-        )
-
-        assert indicator.props["status"] == "warning"
-        assert indicator.props["label"] == "Maintenance Mode"
-
-    def test_generate_status_indicator_error_with_label(self):
-        """Test error status with custom label."""
-        reset_id_counter()
-
-        indicator = generate_status_indicator(
-            status="error",
-            label="Connection Failed"
-        )
-
-        assert indicator.props["status"] == "error"
-        assert indicator.props["label"] == "Connection Failed"
-
-    def test_generate_status_indicator_loading_with_label(self):
-        """Test loading status with custom label."""
-        reset_id_counter()
-
-        indicator = generate_status_indicator(
-            status="loading",
-            label="Fetching data..."
-        )
-
-        assert indicator.props["status"] == "loading"
-        assert indicator.props["label"] == "Fetching data..."
+        assert indicator.props == {"status": status, "label": label}
 
     def test_generate_status_indicator_invalid_status(self):
         """Test status indicator with invalid status raises error."""
-        with pytest.raises(ValueError, match="StatusIndicator status must be one of"):
+        with pytest.raises(ValueError, match=_ERR_STATUS):
             generate_status_indicator(status="invalid")
 
-    def test_generate_status_indicator_empty_label(self):
+    @pytest.mark.parametrize("bad", ["", "   "])
+    def test_generate_status_indicator_empty_label(self, bad):
         """Test status indicator with empty label raises error."""
-        with pytest.raises(ValueError, match="StatusIndicator label cannot be empty"):
-            generate_status_indicator(status="success", label="")
-
-        with pytest.raises(ValueError, match="StatusIndicator label cannot be empty"):
-            generate_status_indicator(status="success", label="   ")
+        with pytest.raises(ValueError, match=_ERR_STATUS_EMPTY):
+            generate_status_indicator(status="success", label=bad)
 
     def test_generate_status_indicator_label_whitespace_trimmed(self):
         """Test that status indicator label whitespace is trimmed."""
-        reset_id_counter()
-
         indicator = generate_status_indicator(
             status="info",
             label="  Processing  "
@@ -377,93 +319,40 @@ class TestTagGenerators:
     # PriorityBadge Generator Tests
     # ========================================================================
 
-    def test_generate_priority_badge_basic(self):
-        """Test basic priority badge generation."""
-        reset_id_counter()
-
-        badge = generate_priority_badge(level="medium")
-
-        assert badge.type == "a2ui.PriorityBadge"
-        assert badge.props["level"] == "medium"
-        assert "label" not in badge.props
-
-    def test_generate_priority_badge_all_levels(self):
-        """Test priority badge with all valid levels."""
-        reset_id_counter()
-
-        valid_levels = ["low", "medium", "high", "critical"]
-        for level in valid_levels:
-            badge = generate_priority_badge(level=level)
-            assert badge.props["level"] == level
-
-    def test_generate_priority_badge_with_custom_label(self):
+    @pytest.mark.parametrize("level", ["low", "medium", "high", "critical"])
+    def test_generate_priority_badge_all_levels(self, level):
+        """Test priority badge with each valid level."""
+        badge = generate_priority_badge(level=level)
+        assert badge.props["level"] == level
+
+    @pytest.mark.parametrize("level,label", [
+        ("high", "Urgent"),
+        ("critical", "Critical - Act Now"),
+        ("low", "Nice to Have"),
+        ("medium", "Normal Priority"),
+    ])
+    def test_generate_priority_badge_with_custom_label(self, level, label):
         """Test priority badge with custom label."""
-        reset_id_counter()
+        badge = generate_priority_badge(level=level, label=label)
 
-        badge = generate_priority_badge(
-            level="high",
-            label="Urgent"
-        )
-
-        assert badge.props["label"] == "Urgent"
-        assert badge.props["level"] == "high"
-
-    def test_generate_priority_badge_critical_with_label(self):
-        """Test critical priority with custom label."""
-        reset_id_counter()
-
-        badge = generate_priority_badge(
-            level="critical",
-            label="Critical - Act Now"
-        )
-
-        assert badge.props["level"] == "critical"
-        assert badge.props["label"] == "Critical - Act Now"
-
-    def test_generate_priority_badge_low_with_label(self):
-        """Test low priority with custom label."""
-        reset_id_counter()
-
-        badge = generate_priority_badge(
-            level="low",
-            label="Nice to Have"
-        )
-
-        assert badge.props["level"] == "low"
-        assert badge.props["label"] == "Nice to Have"
-
-    def test_generate_priority_badge_medium_with_label(self):
-        """Test medium priority with custom label."""
-        reset_id_counter()
-
-        badge = generate_priority_badge(
-            level="medium",
-            label="Normal Priority"
-        )
-
-        assert badge.props["level"] == "medium"
-        assert badge.props["label"] == "Normal Priority"
+        assert badge.props == {"level": level, "label": label}
 
     def test_generate_priority_badge_invalid_level(self):
         """Test priority badge with invalid level raises error."""
-        with pytest.raises(ValueError, match="PriorityBadge level must be one of"):
+        with pytest.raises(ValueError, match=_ERR_PRIORITY_LEVEL):
             generate_priority_badge(level="invalid")
 
-        with pytest.raises(ValueError, match="PriorityBadge level must be one of"):
+        with pytest.raises(ValueError, match=_ERR_PRIORITY_LEVEL):
             generate_priority_badge(level="urgent")
 
-    def test_generate_priority_badge_empty_label(self):
+    @pytest.mark.parametrize("bad", ["", "   "])
+    def test_generate_priority_badge_empty_label(self, bad):
         """Test priority badge with empty label raises error."""
-        with pytest.raises(ValueError, match="PriorityBadge label cannot be empty"):
-            generate_priority_badge(level="high", label="")
-
-        with pytest.raises(ValueError, match="PriorityBadge label cannot be empty"):
-            generate_priority_badge(level="high", label="   ")
+        with pytest.raises(ValueError, match=_ERR_PRIORITY_EMPTY):
+            generate_priority_badge(level="high", label=bad)
 
     def test_generate_priority_badge_label_whitespace_trimmed(self):
         """Test that priority badge label whitespace is trimmed."""
-        reset_id_counter()
-
         badge = generate_priority_badge(
             level="medium",
             label="  Standard  "